@@ -151,7 +151,7 @@ def fara_scrape(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -187,7 +187,7 @@ def uk_orcl_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -222,7 +222,7 @@ def french_hatvp_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -257,7 +257,7 @@ def austrian_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -292,7 +292,7 @@ def cyprus_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -327,7 +327,7 @@ def italian_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -362,7 +362,7 @@ def au_foreign_influence_register(firm_name, output, format):
                     writer.writerows(results)
         else:
             with open(output, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
 
         click.echo(f"Results saved to {output}")
 
@@ -9,6 +9,11 @@ from typing import Dict, List
 
 from .utils.normalize import merge_client_records, validate_record
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup, not available on Windows
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -99,7 +104,7 @@ class LobbyingAggregator:
         elif format == 'json':
             filename = self.output_dir / f"{safe_firm_name}_{timestamp}.json"
             with open(filename, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+                json.dump(results, f, indent=2)
             logger.info(f"Saved JSON to {filename}")
 
         return filename
@@ -108,8 +113,10 @@ def run_aggregator(firm_name: str, output_format: str = 'csv') -> Path:
     """Main entry point for aggregation"""
     aggregator = LobbyingAggregator()
 
-    # Run async aggregation
-    results = asyncio.run(aggregator.aggregate(firm_name))
+    # Run async aggregation; scrapers run in executor threads, so this
+    # loop only schedules I/O and can use uvloop when it is installed
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    results = asyncio.run(aggregator.aggregate(firm_name), loop_factory=loop_factory)
 
     # Save results
     output_file = aggregator.save_results(results, firm_name, output_format)
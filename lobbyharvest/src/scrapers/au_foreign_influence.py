@@ -3,12 +3,17 @@ Australian Foreign Influence Transparency Scheme scraper - extracts registrant/c
 """
 import asyncio
 import logging
+import re
 from typing import Dict, List, Optional
 from playwright.async_api import async_playwright, Page
 from playwright.sync_api import sync_playwright
 
 logger = logging.getLogger(__name__)
 
+# Registration numbers such as "ABC-123", as matched by the async and sync scrapers
+_REG_NUMBER_RE = re.compile(r'[A-Z0-9]{3,}-[A-Z0-9]{3,}')
+_SHORT_REG_NUMBER_RE = re.compile(r'[A-Z0-9]{2,}-[A-Z0-9]{2,}')
+
 async def scrape_async(firm_name: str) -> List[Dict[str, Optional[str]]]:
     """
     Asynchronously scrape client information from Australian Foreign Influence Transparency Scheme
@@ -65,11 +70,12 @@ async def scrape_async(firm_name: str) -> List[Dict[str, Optional[str]]]:
 
             # If no exact matches, try case-insensitive partial match
             if not result_links:
-                all_links = await page.locator('a').all()
-                for link in all_links:
-                    link_text = await link.text_content()
-                    if link_text and firm_name.lower() in link_text.lower():
-                        result_links.append(link)
+                # Read every link's text in one round-trip rather than one per link
+                links = page.locator('a')
+                firm_lower = firm_name.lower()
+                for index, link_text in enumerate(await links.all_text_contents()):
+                    if link_text and firm_lower in link_text.lower():
+                        result_links.append(links.nth(index))
 
             for link in result_links[:3]:  # Process first 3 matches
                 try:
@@ -122,8 +128,7 @@ async def extract_registrant_details(page: Page, firm_name: str) -> List[Dict[st
             reg_elem = page.locator('text=/.*[A-Z0-9]{3,}-[A-Z0-9]{3,}.*/i')
             if await reg_elem.count() > 0:
                 reg_text = await reg_elem.first.text_content()
-                import re
-                match = re.search(r'[A-Z0-9]{3,}-[A-Z0-9]{3,}', reg_text)
+                match = _REG_NUMBER_RE.search(reg_text)
                 if match:
                     reg_number = match.group(0)
 
@@ -277,11 +282,12 @@ def scrape(firm_name: str) -> List[Dict[str, Optional[str]]]:
 
             # If no exact matches, try case-insensitive partial match
             if not result_links:
-                all_links = page.locator('a').all()
-                for link in all_links:
-                    link_text = link.text_content()
-                    if link_text and firm_name.lower() in link_text.lower():
-                        result_links.append(link)
+                # Read every link's text in one round-trip rather than one per link
+                links = page.locator('a')
+                firm_lower = firm_name.lower()
+                for index, link_text in enumerate(links.all_text_contents()):
+                    if link_text and firm_lower in link_text.lower():
+                        result_links.append(links.nth(index))
 
             for link in result_links[:3]:  # Process first 3 matches
                 try:
@@ -334,8 +340,7 @@ def extract_registrant_details_sync(page, firm_name: str) -> List[Dict[str, Opti
             reg_elem = page.locator('text=/[A-Z0-9]{2,}-[A-Z0-9]{2,}/i').first
             if reg_elem.count() > 0:
                 reg_text = reg_elem.text_content()
-                import re
-                match = re.search(r'[A-Z0-9]{2,}-[A-Z0-9]{2,}', reg_text)
+                match = _SHORT_REG_NUMBER_RE.search(reg_text)
                 if match:
                     reg_number = match.group(0)
 
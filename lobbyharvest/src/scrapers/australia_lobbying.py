@@ -8,6 +8,16 @@ from playwright.sync_api import sync_playwright, Page
 
 logger = logging.getLogger(__name__)
 
+# Compiled once rather than per row or element
+_ABN_RE = re.compile(r'\b\d{2}\s?\d{3}\s?\d{3}\s?\d{3}\b')
+_WHITESPACE_RE = re.compile(r'\s')
+# "Client: XYZ" in result rows, and "Client: Name" or "Clients: Name1, Name2" in page text
+_ROW_CLIENT_RE = re.compile(r'[Cc]lient[s]?[:\s]+([^,\n]+)')
+_PAGE_CLIENTS_RE = re.compile(r'[Cc]lients?[:\s]+([^.\n]{3,100})')
+
+# Maps table rows to their cell texts in the browser
+_ROW_CELL_TEXTS_JS = "rows => rows.map(row => Array.from(row.querySelectorAll('td'), cell => cell.textContent || ''))"
+
 def scrape(firm_name: str) -> List[Dict[str, Optional[str]]]:
     """
     Scrape client information from Australian Lobbying Register
@@ -125,7 +135,7 @@ def extract_details_from_page(page: Page, firm_name: str) -> List[Dict[str, Opti
         if abn_elem.count() > 0:
             abn_text = abn_elem.text_content()
             if abn_text:
-                firm_abn = re.sub(r'\s', '', abn_text)
+                firm_abn = _WHITESPACE_RE.sub('', abn_text)
 
         # Look for client sections
         client_sections = [
@@ -145,31 +155,29 @@ def extract_details_from_page(page: Page, firm_name: str) -> List[Dict[str, Opti
                     # Check for tables
                     tables = parent.locator('table').all()
                     for table in tables:
-                        rows = table.locator('tbody tr, tr').all()
-                        for row in rows[1:]:  # Skip header
-                            cells = row.locator('td').all()
+                        # Read every row's cell texts in one round-trip
+                        rows = table.locator('tbody tr, tr').evaluate_all(_ROW_CELL_TEXTS_JS)
+                        for cells in rows[1:]:  # Skip header
                             if cells:
-                                client_name = cells[0].text_content()
+                                client_name = cells[0]
                                 if client_name and len(client_name.strip()) > 3:
                                     clients.append({
                                         'firm_name': firm_name,
                                         'firm_registration_number': firm_abn,
                                         'client_name': client_name.strip(),
-                                        'client_registration_number': cells[1].text_content().strip() if len(cells) > 1 else None,
-                                        'client_start_date': cells[2].text_content().strip() if len(cells) > 2 else None,
-                                        'client_end_date': cells[3].text_content().strip() if len(cells) > 3 else None
+                                        'client_registration_number': cells[1].strip() if len(cells) > 1 else None,
+                                        'client_start_date': cells[2].strip() if len(cells) > 2 else None,
+                                        'client_end_date': cells[3].strip() if len(cells) > 3 else None
                                     })
 
                     # Check for lists
                     lists = parent.locator('ul, ol').all()
                     for lst in lists:
-                        items = lst.locator('li').all()
-                        for item in items:
-                            client_name = item.text_content()
+                        for client_name in lst.locator('li').all_text_contents():
                             if client_name and len(client_name.strip()) > 3:
                                 # Extract ABN if present
                                 client_abn = None
-                                abn_match = re.search(r'\b\d{2}\s?\d{3}\s?\d{3}\s?\d{3}\b', client_name)
+                                abn_match = _ABN_RE.search(client_name)
                                 if abn_match:
                                     client_abn = abn_match.group(0).replace(' ', '')
                                     client_name = client_name.replace(abn_match.group(0), '').strip()
@@ -198,9 +206,8 @@ def extract_from_result_row(result, firm_name: str) -> List[Dict[str, Optional[s
         if text_content and 'client' in text_content.lower():
             # Try to extract structured data
             # Look for patterns like "Client: XYZ"
-            import re
-            client_matches = re.findall(r'[Cc]lient[s]?[:\s]+([^,\n]+)', text_content)
-            for match in client_matches:
+            for client_match in _ROW_CLIENT_RE.finditer(text_content):
+                match = client_match.group(1)
                 if match and len(match.strip()) > 3:
                     clients.append({
                         'firm_name': firm_name,
@@ -227,10 +234,9 @@ def extract_clients_from_page(page: Page, firm_name: str) -> List[Dict[str, Opti
             text = elem.text_content()
             if text and len(text) < 500:  # Avoid very long text blocks
                 # Look for patterns
-                import re
                 # Pattern: "Client: Name" or "Clients: Name1, Name2"
-                matches = re.findall(r'[Cc]lients?[:\s]+([^.\n]{3,100})', text)
-                for match in matches:
+                for client_match in _PAGE_CLIENTS_RE.finditer(text):
+                    match = client_match.group(1)
                     # Split by comma if multiple
                     names = [n.strip() for n in match.split(',')]
                     for name in names:
@@ -5,6 +5,7 @@ URL: https://www.iaac.org.cy/iaac/iaac.nsf/table3_el/table3_el?openform
 
 import asyncio
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional
 from playwright.async_api import async_playwright
 from datetime import datetime
@@ -46,18 +47,14 @@ async def scrape_cyprus_lobbying(firm_name: str) -> List[Dict]:
             # Wait for content to load
             await asyncio.sleep(3)
 
-            # Get all table rows
-            all_rows = await page.query_selector_all('tr')
-
-            for row in all_rows[1:]:  # Skip header row
-                cells = await row.query_selector_all('td')
+            # Get the cell texts of all table rows in one round-trip
+            all_rows = await page.eval_on_selector_all(
+                'tr', 'rows => rows.map(row => Array.from(row.querySelectorAll("td"), cell => cell.innerText))')
 
+            for cells in all_rows[1:]:  # Skip header row
                 if cells and len(cells) >= 7:  # Ensure we have enough columns
                     # Extract text from all cells
-                    row_data = []
-                    for cell in cells:
-                        text = await cell.inner_text()
-                        row_data.append(text.strip())
+                    row_data = [text.strip() for text in cells]
 
                     # Column mapping based on observed structure:
                     # 0: Number
@@ -115,20 +112,30 @@ def check_firm_match(text: str, firm_name: str) -> bool:
     Returns:
         True if match found, False otherwise
     """
-    text_lower = text.lower()
+    return _firm_pattern(firm_name).search(text) is not None
+
+
+@lru_cache(maxsize=32)
+def _firm_pattern(firm_name: str) -> re.Pattern:
+    """
+    Compile every accepted form of a firm name into one case-insensitive pattern,
+    so each row is matched in a single scan without lowercasing its text.
+
+    Args:
+        firm_name: Firm name to match against
+
+    Returns:
+        Pattern matching the name, its known variations, or its base name
+    """
     firm_lower = firm_name.lower()
 
     # Direct match
-    if firm_lower in text_lower:
-        return True
+    variations = [firm_lower]
 
     # Special cases for FTI Consulting
     if 'fti' in firm_lower:
         # Check for Greek variations
-        greek_variations = ['εφ.τι.αϊ', 'εφτιαϊ', 'εφ.τι.αι', 'εφτιαι']
-        for variation in greek_variations:
-            if variation in text_lower:
-                return True
+        variations.extend(['εφ.τι.αϊ', 'εφτιαϊ', 'εφ.τι.αι', 'εφτιαι'])
 
     # Remove common suffixes and check again
     suffixes = ['consulting', 'ltd', 'limited', 'plc', 'inc', 'corporation', 'corp']
@@ -136,10 +143,10 @@ def check_firm_match(text: str, firm_name: str) -> bool:
     for suffix in suffixes:
         firm_base = firm_base.replace(suffix, '').strip()
 
-    if firm_base and firm_base in text_lower:
-        return True
+    if firm_base:
+        variations.append(firm_base)
 
-    return False
+    return re.compile('|'.join(map(re.escape, variations)), re.IGNORECASE)
 
 
 def normalize_date(date_str: str) -> str:
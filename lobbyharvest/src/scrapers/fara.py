@@ -3,14 +3,86 @@ FARA (Foreign Agents Registration Act) scraper - extracts client data from US FA
 """
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import requests
+import urllib3
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Oracle APEX exposes the session instance either in the page body or the redirect URL
+_APEX_INSTANCE_RE = re.compile(rb'p_instance["\']?\s*[:=]\s*["\']?(\d+)')
+_APEX_URL_INSTANCE_RE = re.compile(r':(\d+):')
+
+# Detail pages without any of the labels extract_client_info looks for are skipped unparsed
+_DETAIL_MARKER_RE = re.compile(rb'foreign principal|client', re.I)
+
+# Skip SSL verification for FARA site due to certificate issues
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+})
+_session.verify = False
+
+@lru_cache(maxsize=32)
+def _get_instance_id(session: requests.Session, search_url: str) -> Optional[str]:
+    """Fetch the search page once per session and extract the APEX instance ID"""
+    response = session.get(search_url, timeout=10)
+    response.raise_for_status()
+
+    # Search the raw bytes so the page never has to be decoded
+    apex_match = _APEX_INSTANCE_RE.search(response.content)
+    if apex_match:
+        return apex_match.group(1).decode()
+
+    # Try to extract from URL redirects
+    instance_match = _APEX_URL_INSTANCE_RE.search(response.url)
+    return instance_match.group(1) if instance_match else None
+
+def _search_registrations(session: requests.Session, base_url: str, instance_id: str, firm_name: str):
+    """Search FARA for a firm and return the registrations results table, if any"""
+    # Search for the firm using APEX AJAX
+    search_params = {
+        'p_flow_id': '1381',
+        'p_flow_step_id': '200',
+        'p_instance': instance_id,
+        'p_debug': '',
+        'p_request': 'SEARCH',
+        'p_widget_name': 'apex.go',
+        'p_widget_action': 'reset',
+        'x01': firm_name,  # Search term
+        'x02': 'P200_SEARCH'  # Field name
+    }
+
+    # Try POST request for search
+    ajax_url = f"{base_url}/wwv_flow.ajax"
+    search_response = session.post(ajax_url, data=search_params, timeout=10)
+
+    # If AJAX doesn't work, try direct page navigation with search
+    if search_response.status_code != 200:
+        # Alternative: Try navigating with search in URL
+        alt_search_url = f"{base_url}/f?p=1381:200:{instance_id}::NO:200:P200_SEARCH:{firm_name}"
+        search_response = session.get(alt_search_url, timeout=10)
+
+    if search_response.status_code != 200:
+        return None
+
+    search_soup = BeautifulSoup(search_response.text, 'lxml')
+
+    # Look for registration results table
+    results_table = search_soup.find('table', class_='t-Report-report')
+    if not results_table:
+        # Try alternative table classes
+        results_table = search_soup.find('table', {'id': re.compile(r'report', re.I)})
+    return results_table
+
 def scrape_fara(firm_name: str) -> List[Dict[str, Optional[str]]]:
     """
     Scrape client information from FARA database
@@ -24,100 +96,75 @@ def scrape_fara(firm_name: str) -> List[Dict[str, Optional[str]]]:
     clients = []
     base_url = "https://efile.fara.gov/ords/fara"
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-    })
-    # Skip SSL verification for FARA site due to certificate issues
-    session.verify = False
-    # Suppress SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    session = _session
 
     try:
-        # First, search for the firm
+        # FARA uses Oracle APEX which requires session management; the
+        # instance ID is stable for the session so it is only parsed once
         search_url = f"{base_url}/f?p=1381:200"
-        response = session.get(search_url, timeout=10)
-        response.raise_for_status()
-
-        # Try to find a session ID or form token
-        # FARA uses Oracle APEX which requires session management
-        # Look for the APEX session in the page
-        apex_match = re.search(r'p_instance["\']?\s*[:=]\s*["\']?(\d+)', response.text)
-        if apex_match:
-            instance_id = apex_match.group(1)
-        else:
-            # Try to extract from URL redirects or page content
-            instance_match = re.search(r':(\d+):', response.url)
-            if instance_match:
-                instance_id = instance_match.group(1)
-            else:
+        for attempt in range(2):
+            instance_id = _get_instance_id(session, search_url)
+            if not instance_id:
+                _get_instance_id.cache_clear()
                 logger.error("Could not find APEX instance ID")
                 return []
 
-        # Search for the firm using APEX AJAX
-        search_params = {
-            'p_flow_id': '1381',
-            'p_flow_step_id': '200',
-            'p_instance': instance_id,
-            'p_debug': '',
-            'p_request': 'SEARCH',
-            'p_widget_name': 'apex.go',
-            'p_widget_action': 'reset',
-            'x01': firm_name,  # Search term
-            'x02': 'P200_SEARCH'  # Field name
-        }
-
-        # Try POST request for search
-        ajax_url = f"{base_url}/wwv_flow.ajax"
-        search_response = session.post(ajax_url, data=search_params, timeout=10)
-
-        # If AJAX doesn't work, try direct page navigation with search
-        if search_response.status_code != 200:
-            # Alternative: Try navigating with search in URL
-            alt_search_url = f"{base_url}/f?p=1381:200:{instance_id}::NO:200:P200_SEARCH:{firm_name}"
-            search_response = session.get(alt_search_url, timeout=10)
-
-        if search_response.status_code == 200:
-            search_soup = BeautifulSoup(search_response.text, 'lxml')
-
-            # Look for registration results table
-            results_table = search_soup.find('table', class_='t-Report-report')
-            if not results_table:
-                # Try alternative table classes
-                results_table = search_soup.find('table', {'id': re.compile(r'report', re.I)})
-
-            if results_table:
-                rows = results_table.find_all('tr')[1:]  # Skip header
-
-                for row in rows[:5]:  # Process first 5 registrations
-                    cells = row.find_all(['td', 'th'])
-
-                    if len(cells) >= 2:
-                        # Extract registration number
-                        reg_link = cells[1].find('a')
-                        if reg_link:
-                            reg_number = reg_link.get_text(strip=True)
-
-                            # Follow the registration link to get details
-                            reg_href = reg_link.get('href')
-                            if reg_href:
-                                if not reg_href.startswith('http'):
-                                    reg_href = base_url + '/' + reg_href.lstrip('/')
-
-                                detail_response = session.get(reg_href, timeout=10)
-                                if detail_response.status_code == 200:
-                                    detail_soup = BeautifulSoup(detail_response.text, 'lxml')
-
-                                    # Extract client information from detail page
-                                    client_info = extract_client_info(detail_soup, firm_name, reg_number)
-                                    if client_info:
-                                        clients.extend(client_info)
-            else:
-                logger.warning("No results table found in FARA search")
+            results_table = _search_registrations(session, base_url, instance_id, firm_name)
+            if results_table or attempt:
+                break
+
+            # An expired APEX session still answers 200 but without results,
+            # so retry once with a fresh instance ID
+            _get_instance_id.cache_clear()
+
+        if results_table:
+            rows = results_table.find_all('tr')[1:]  # Skip header
+
+            registrations = []
+            for row in rows[:5]:  # Process first 5 registrations
+                cells = row.find_all(['td', 'th'])
+
+                if len(cells) >= 2:
+                    # Extract registration number
+                    reg_link = cells[1].find('a')
+                    if reg_link:
+                        reg_number = reg_link.get_text(strip=True)
+
+                        # Follow the registration link to get details
+                        reg_href = reg_link.get('href')
+                        if reg_href:
+                            if not reg_href.startswith('http'):
+                                reg_href = base_url + '/' + reg_href.lstrip('/')
+                            registrations.append((reg_number, reg_href))
+
+            # Prefetch detail pages in the background so the next download
+            # overlaps with parsing the current one
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pending = [(reg_number, executor.submit(session.get, reg_href, timeout=10))
+                           for reg_number, reg_href in registrations]
+
+                for reg_number, future in pending:
+                    detail_response = future.result()
+                    if detail_response.status_code != 200:
+                        continue
+
+                    # Cheap scan of the raw bytes before building a parse tree
+                    if not _DETAIL_MARKER_RE.search(detail_response.content):
+                        logger.debug(f"No client labels on detail page for {reg_number}")
+                        continue
+
+                    detail_soup = BeautifulSoup(detail_response.content, 'lxml')
+
+                    # Extract client information from detail page
+                    client_info = extract_client_info(detail_soup, firm_name, reg_number)
+                    if client_info:
+                        clients.extend(client_info)
+        else:
+            logger.warning("No results table found in FARA search")
 
     except requests.RequestException as e:
+        # The APEX session may have expired, so start afresh next time
+        _get_instance_id.cache_clear()
         logger.error(f"Failed to fetch FARA data: {e}")
     except Exception as e:
         logger.error(f"Error processing FARA data: {e}")
@@ -4,14 +4,182 @@ URL: https://www.hatvp.fr/le-repertoire/
 """
 
 import asyncio
-from typing import List, Dict
-from playwright.async_api import async_playwright, Page, Browser
+import csv
+import io
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+import httpx
+import lxml.html
+from playwright.async_api import Page, Browser, TimeoutError as PlaywrightTimeout
 import json
 
+from ..utils.browser import block_heavy_resources, browser_session, get_browser
+from ..utils.cache import read_cached_data, read_cached_html, write_cached_data, write_cached_html
+from ..utils.normalize import normalize_firm_name
+from ..utils.records import ClientRecord
+
+REPERTOIRE_URL = 'https://www.hatvp.fr/le-repertoire/'
+
+# Seconds allowed per firm in a batch before it is abandoned
+FIRM_TIMEOUT = 25
+
+# Detail page snapshots are cached under this namespace
+CACHE_NAMESPACE = 'hatvp'
+
+# Detail pages are keyed by the organisation's national identifier (SIREN/RNA)
+DETAIL_URL = 'https://www.hatvp.fr/fiche-organisation/?organisation={}'
+
+# HATVP open data listing every registered organisation; the search
+# autocomplete is backed by the same register
+ORGANISATIONS_CSV_URL = 'https://www.hatvp.fr/agora/opendata/csv/1_informations_generales.csv'
+
+# Detail pages are identified by their URL
+_DETAIL_URL_RE = re.compile(r'fiche-organisation|organisation=')
+
+# Runs of source whitespace, which the browser renders as a single space
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Bulleted client line, with any trailing "Voir la fiche" link text removed
+_BULLET_RE = re.compile(r'^•\s+(.+?)(?:\s+Voir la fiche)?\s*$')
+
+# Section headers and metadata that appear as bullet points alongside clients
+SKIP_WORDS = frozenset({
+    'identité', 'fonction', 'niveau', 'secteur', 'domaine',
+    'président', 'directeur', 'consultant', 'associé', 'local',
+    'national', 'economie', 'finances', 'environnement', 'numérique',
+    'santé', 'transport', 'energie', 'agriculture'
+})
+
+# Lines that open and close the section listing a firm's clients
+CLIENT_SECTION_HEADERS = ('actions de représentation', 'clients', 'mandants')
+SECTION_END_WORDS = ('rapport', 'déclaration', 'informations')
+
+# Legal forms that mark a line as a company name
+COMPANY_INDICATORS = frozenset({
+    'SAS', 'SARL', 'SA ', 'EURL', 'SNC', 'ASSOCIATION',
+    'FONDATION', 'GROUPE', 'INSTITUT', 'FEDERATION',
+    'SYNDICAT', 'UNION', 'SOCIETE', 'MUTUELLE'
+})
+
+# Elements that start a new line in the rendered text, as innerText would
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tbody', 'td', 'th', 'thead', 'tr', 'ul'
+})
+
+# Resolved detail page URLs are cached per firm so repeated runs skip the
+# lookup; they are re-resolved after this many seconds in case they change
+DETAIL_URL_TTL = 7 * 24 * 60 * 60
+
+# Normalised organisation name -> national identifier, loaded once per process
+# A thread lock, since scrapers may run on several event loops in different threads
+_organisations: Optional[Dict[str, str]] = None
+_organisations_lock = threading.Lock()
+
+
+def _load_organisations() -> Dict[str, str]:
+    """
+    Download the register's organisation list, once per process.
+
+    Returns:
+        Mapping of normalised organisation name to national identifier
+    """
+    global _organisations
+
+    with _organisations_lock:
+        if _organisations is None:
+            response = httpx.get(ORGANISATIONS_CSV_URL, timeout=30, follow_redirects=True)
+            response.raise_for_status()
+
+            reader = csv.DictReader(io.StringIO(response.text), delimiter=';')
+            _organisations = {
+                normalize_firm_name(row['denomination']): row['identifiant_national'].strip()
+                for row in reader
+                if row.get('denomination') and row.get('identifiant_national')
+            }
+
+    return _organisations
+
+
+def _cached_detail_url(firm_name: str) -> Optional[str]:
+    """
+    Return the detail page URL recently resolved for a firm, if any.
+    """
+    return read_cached_data(CACHE_NAMESPACE, f'detail_url:{firm_name}', ttl=DETAIL_URL_TTL)
+
+
+def _remember_detail_url(firm_name: str, detail_url: str) -> None:
+    """
+    Record a firm's detail page URL on disk, in its own cache entry so
+    concurrent workers never overwrite each other's lookups.
+
+    Only call this for exact name matches, so a wrong guess is never reused.
+    """
+    write_cached_data(CACHE_NAMESPACE, f'detail_url:{firm_name}', detail_url)
+
+
+def _match_organisation(organisations: Dict[str, str], firm_name: str) -> Tuple[Optional[str], bool]:
+    """
+    Find the identifier of the organisation a firm name refers to.
+
+    The open data is in no useful order, so a name only counts as a match if
+    it equals an organisation's normalised name, or appears as whole words in
+    exactly one of them.
+
+    Returns:
+        National identifier, or None if no organisation matches unambiguously,
+        and whether the names matched exactly
+    """
+    key = normalize_firm_name(firm_name)
+    if not key:
+        return None, False
+
+    identifier = organisations.get(key)
+    if identifier:
+        return identifier, True
+
+    pattern = re.compile(rf'\b{re.escape(key)}\b')
+    matches = {ident for name, ident in organisations.items() if pattern.search(name)}
+    return (matches.pop() if len(matches) == 1 else None), False
+
+
+async def _resolve_detail_url(firm_name: str) -> Optional[str]:
+    """
+    Look up a firm's detail page URL without going through the search form.
+
+    Args:
+        firm_name: Name of the lobbying firm to search for
+
+    Returns:
+        Detail page URL, or None if no organisation matches unambiguously
+    """
+    detail_url = _cached_detail_url(firm_name)
+    if detail_url:
+        return detail_url
+
+    organisations = await asyncio.to_thread(_load_organisations)
+    identifier, exact = _match_organisation(organisations, firm_name)
+    if not identifier:
+        return None
+
+    detail_url = DETAIL_URL.format(identifier)
+    if exact:
+        _remember_detail_url(firm_name, detail_url)
+    return detail_url
+
 
 async def navigate_to_detail_page(page: Page, firm_name: str) -> bool:
     """
-    Navigate to the detail page for a firm using the search autocomplete.
+    Navigate to the detail page for a firm.
+
+    The detail URL is taken from earlier runs or resolved from the register's
+    open data and opened directly; the search autocomplete is only used if
+    that lookup fails. URLs from exact name matches are remembered for next time.
 
     Args:
         page: Playwright page object
@@ -21,11 +189,18 @@ async def navigate_to_detail_page(page: Page, firm_name: str) -> bool:
         True if successfully navigated to detail page, False otherwise
     """
     try:
-        # Navigate to HATVP repertoire page
-        await page.goto('https://www.hatvp.fr/le-repertoire/', wait_until='domcontentloaded')
+        detail_url = await _resolve_detail_url(firm_name)
+    except (httpx.HTTPError, csv.Error) as e:
+        print(f"Could not resolve detail URL for {firm_name}, using search: {e}")
+        detail_url = None
 
-        # Wait for the page to fully load
-        await asyncio.sleep(3)
+    try:
+        if detail_url:
+            await page.goto(detail_url, wait_until='domcontentloaded', timeout=10000)
+            return True
+
+        # Navigate to HATVP repertoire page
+        await page.goto(REPERTOIRE_URL, wait_until='domcontentloaded', timeout=10000)
 
         # Find the search input by ID
         search_input = await page.wait_for_selector('#search', timeout=10000)
@@ -35,37 +210,48 @@ async def navigate_to_detail_page(page: Page, firm_name: str) -> bool:
             await search_input.type(firm_name, delay=100)
 
             # Wait for autocomplete suggestions to appear
-            await asyncio.sleep(2)
+            try:
+                await page.wait_for_selector('.tt-suggestion', timeout=2500)
+            except PlaywrightTimeout:
+                pass
 
             # Look for autocomplete suggestions
             suggestions = await page.query_selector_all('.tt-suggestion')
 
             if suggestions:
+                # Read all suggestion texts in a single round-trip
+                suggestion_texts = await page.eval_on_selector_all(
+                    '.tt-suggestion', 'els => els.map(e => e.innerText)'
+                )
+
                 # Find the most relevant suggestion
-                for suggestion in suggestions:
-                    suggestion_text = await suggestion.inner_text()
+                firm_lower = firm_name.lower()
+                firm_key = normalize_firm_name(firm_name)
+                for suggestion, suggestion_text in zip(suggestions, suggestion_texts):
                     # Check if this suggestion contains our firm name (case insensitive)
-                    if firm_name.lower() in suggestion_text.lower():
+                    if firm_lower in suggestion_text.lower():
                         # Click on this suggestion
                         await suggestion.click()
-                        # Wait for navigation to complete
-                        await page.wait_for_load_state('networkidle')
-                        await asyncio.sleep(2)
 
-                        # Check if we're on a detail page by looking for URL pattern
-                        current_url = page.url
-                        if 'fiche-organisation' in current_url or 'organisation=' in current_url:
+                        # Wait until we land on a detail page
+                        try:
+                            await page.wait_for_url(_DETAIL_URL_RE, timeout=5000)
+                            if normalize_firm_name(suggestion_text) == firm_key:
+                                _remember_detail_url(firm_name, page.url)
                             return True
+                        except PlaywrightTimeout:
+                            pass
                         break
             else:
                 # If no autocomplete, try pressing Enter
                 await page.keyboard.press('Enter')
-                await page.wait_for_load_state('networkidle')
-                await asyncio.sleep(2)
 
                 # Check if we navigated somewhere
-                if page.url != 'https://www.hatvp.fr/le-repertoire/':
+                try:
+                    await page.wait_for_url(lambda url: url != REPERTOIRE_URL, timeout=5000)
                     return True
+                except PlaywrightTimeout:
+                    pass
 
         return False
 
@@ -74,7 +260,56 @@ async def navigate_to_detail_page(page: Page, firm_name: str) -> bool:
         return False
 
 
-async def extract_clients_from_detail_page(page: Page, firm_name: str) -> List[Dict]:
+def iter_html_lines(html: str) -> Iterator[str]:
+    """
+    Yield the non-empty text lines a browser would render for page HTML.
+
+    Args:
+        html: Page HTML snapshot
+
+    Yields:
+        Stripped text lines
+    """
+    tree = lxml.html.fromstring(html)
+    body = tree.find('body')
+    if body is None:
+        body = tree
+
+    for element in list(body.iter('script', 'style', 'noscript', 'template')):
+        element.drop_tree()
+
+    # Collapse source whitespace first, so only block boundaries start new lines
+    for element in body.iter():
+        if element.text:
+            element.text = _WHITESPACE_RE.sub(' ', element.text)
+        if element.tail:
+            element.tail = _WHITESPACE_RE.sub(' ', element.tail)
+
+    for element in body.iter(*BLOCK_TAGS):
+        element.text = '\n' + (element.text or '')
+        element.tail = '\n' + (element.tail or '')
+
+    for line in body.text_content().splitlines():
+        line = line.strip()
+        if line:
+            yield line
+
+
+async def snapshot_detail_page(page: Page) -> str:
+    """
+    Wait for a firm's detail page to load and return its HTML.
+
+    Args:
+        page: Playwright page object on the detail page
+
+    Returns:
+        Page HTML snapshot
+    """
+    await page.wait_for_selector('body', timeout=5000)
+    return await page.content()
+
+
+async def extract_clients_from_detail_page(page: Page, firm_name: str) -> List[ClientRecord]:
     """
     Extract client information from a firm's detail page.
 
@@ -83,102 +318,112 @@ async def extract_clients_from_detail_page(page: Page, firm_name: str) -> List[D
         firm_name: Name of the lobbying firm
 
     Returns:
-        List of dictionaries containing client information
+        List of client records
+    """
+    try:
+        html = await snapshot_detail_page(page)
+    except Exception as e:
+        print(f"Error extracting clients: {e}")
+        return []
+
+    return extract_clients_from_html(html, firm_name)
+
+
+def _client_record(firm_name: str, client_name: str) -> ClientRecord:
+    """
+    Build a client record; HATVP leaves the unknown fields as empty strings.
+    """
+    return ClientRecord(
+        firm_name=firm_name,
+        firm_registration_number='',
+        client_name=client_name,
+        client_registration_number='',
+        start_date='',
+        end_date=''
+    )
+
+
+def extract_clients_from_html(html: str, firm_name: str) -> List[ClientRecord]:
+    """
+    Extract client information from a firm's detail page HTML.
+
+    Args:
+        html: Detail page HTML snapshot
+        firm_name: Name of the lobbying firm
+
+    Returns:
+        List of client records
     """
     results = []
+    seen_clients: set[str] = set()
+
+    # Bullets outside any client section, only used when no section lists any
+    loose_results = []
+    seen_loose_clients: set[str] = set()
+
+    # Section-based candidates, only used when the page has no bullet listings
+    section_results = []
+    seen_section_clients: set[str] = set()
+    in_client_section = False
 
     try:
-        # Wait for content to load
-        await page.wait_for_selector('body', timeout=5000)
-
-        # Extract visible text from the page
-        all_text = await page.inner_text('body')
-
-        # Split text into lines and clean them
-        lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-
-        # Look for client listings - they typically start with bullet points
-        for i, line in enumerate(lines):
-            # Check if this line contains a client name
-            # Clients are typically listed with bullet points (•) and may have "Voir la fiche" link
-            if line.startswith('• '):
-                # Extract the client name, removing the bullet and any "Voir la fiche" text
-                client_name = line[2:].strip()  # Remove bullet point
-                client_name = client_name.replace(' Voir la fiche', '').strip()
-
-                # Skip if this is not a valid client name
-                if not client_name:
-                    continue
-
-                # Skip section headers and metadata
-                skip_words = ['identité', 'fonction', 'niveau', 'secteur', 'domaine',
-                              'président', 'directeur', 'consultant', 'associé', 'local',
-                              'national', 'economie', 'finances', 'environnement', 'numérique',
-                              'santé', 'transport', 'energie', 'agriculture']
-                if any(skip in client_name.lower() for skip in skip_words):
-                    continue
-
-                # Skip single words (likely section headers)
-                if ' ' not in client_name and client_name.upper() != client_name:
-                    continue
-
-                # Create client record
-                client_record = {
-                    'firm_name': firm_name,
-                    'firm_registration_number': '',
-                    'client_name': client_name,
-                    'client_registration_number': '',
-                    'start_date': '',
-                    'end_date': ''
-                }
-
-                # Only add if we haven't seen this client yet
-                if not any(r['client_name'] == client_record['client_name'] for r in results):
-                    results.append(client_record)
-
-        # Alternative approach: look for clients in specific sections
-        if not results:
-            in_client_section = False
-
-            for line in lines:
-                line_lower = line.lower()
-
-                # Check if we're entering a clients section
-                if 'actions de représentation' in line_lower or 'clients' in line_lower or 'mandants' in line_lower:
-                    in_client_section = True
-                    continue
-
-                # Check if we're leaving the clients section
-                if in_client_section and any(section in line_lower for section in ['rapport', 'déclaration', 'informations']):
-                    in_client_section = False
-                    continue
-
-                # If we're in the client section and the line looks like a company name
-                if in_client_section and line:
-                    # Basic validation for company names
-                    if (len(line) > 3 and len(line) < 200 and
-                        not line.lower().startswith(('http', 'www')) and
-                        not '@' in line and
-                        not line.isdigit() and
-                        not any(skip in line_lower for skip in ['téléphone', 'email', 'adresse', 'contact'])):
-
-                        # Check if it contains typical company indicators
-                        company_indicators = ['SAS', 'SARL', 'SA ', 'EURL', 'SNC', 'ASSOCIATION',
-                                            'FONDATION', 'GROUPE', 'INSTITUT', 'FEDERATION',
-                                            'SYNDICAT', 'UNION', 'SOCIETE', 'MUTUELLE']
-
-                        if any(indicator in line.upper() for indicator in company_indicators):
-                            client_record = {
-                                'firm_name': firm_name,
-                                'firm_registration_number': '',
-                                'client_name': line,
-                                'client_registration_number': '',
-                                'start_date': '',
-                                'end_date': ''
-                            }
-
-                            if not any(r['client_name'] == client_record['client_name'] for r in results):
-                                results.append(client_record)
+        # Scan the page once, collecting bullet listings and section candidates together
+        for line in iter_html_lines(html):
+            line_lower = line.lower()
+
+            # Look for client listings - they start with bullet points (•) and may
+            # end with a "Voir la fiche" link. Bullets are matched before the
+            # section checks, so a client whose name contains a section word is
+            # never taken for a section header or end
+            match = _BULLET_RE.match(line)
+            if match:
+                client_name = match.group(1).strip()
+                client_lower = client_name.lower()
+
+                # Skip empty names, section headers and metadata, and single words
+                # (likely section headers) unless they are acronyms
+                if (client_name and
+                    not any(skip in client_lower for skip in SKIP_WORDS) and
+                    (' ' in client_name or client_name.isupper())):
+                    if in_client_section:
+                        if client_name not in seen_clients:
+                            seen_clients.add(client_name)
+                            results.append(_client_record(firm_name, client_name))
+                    elif client_name not in seen_loose_clients:
+                        seen_loose_clients.add(client_name)
+                        loose_results.append(_client_record(firm_name, client_name))
+
+            # Check if we're entering a clients section
+            elif any(header in line_lower for header in CLIENT_SECTION_HEADERS):
+                in_client_section = True
+                continue
+
+            # Check if we're leaving the clients section
+            elif in_client_section and any(section in line_lower for section in SECTION_END_WORDS):
+                in_client_section = False
+                # Clients are listed in one section, so nothing after it is needed
+                if results:
+                    break
+                continue
+
+            # Alternative approach: if we're in the client section and the line
+            # looks like a company name
+            if in_client_section and not results:
+                # Basic validation for company names
+                if (len(line) > 3 and len(line) < 200 and
+                    not line_lower.startswith(('http', 'www')) and
+                    not '@' in line and
+                    not line.isdigit() and
+                    not any(skip in line_lower for skip in ['téléphone', 'email', 'adresse', 'contact'])):
+
+                    # Check if it contains typical company indicators
+                    line_upper = line.upper()
+                    if any(indicator in line_upper for indicator in COMPANY_INDICATORS):
+                        if line not in seen_section_clients:
+                            seen_section_clients.add(line)
+                            section_results.append(_client_record(firm_name, line))
+
+        results = results or loose_results or section_results
 
         print(f"Extracted {len(results)} unique clients")
 
@@ -198,47 +443,135 @@ async def scrape_french_hatvp(firm_name: str) -> List[Dict]:
     Returns:
         List of dictionaries containing client information
     """
+    # Re-runs reuse the detail page snapshot and skip the browser entirely
+    html = read_cached_html(CACHE_NAMESPACE, firm_name)
+    if html is not None:
+        print(f"Using cached detail page for {firm_name}")
+        return [record.to_dict() for record in extract_clients_from_html(html, firm_name)]
+
+    # The session closes the shared browser afterwards unless a batch is using it
+    async with browser_session():
+        try:
+            results = await _scrape_one(await get_browser(), firm_name)
+        except Exception as e:
+            print(f"Error in main scraping function: {e}")
+            results = []
+
+    return [record.to_dict() for record in results]
+
+
+async def _scrape_one(browser: Browser, firm_name: str) -> List[ClientRecord]:
+    """
+    Scrape one firm in its own context on an already running browser.
+
+    Args:
+        browser: Shared browser to open the context on
+        firm_name: Name of the lobbying firm to search for
+
+    Returns:
+        List of client records
+    """
     results = []
-    browser = None
+
+    context = await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        service_workers='block'
+    )
 
     try:
-        async with async_playwright() as p:
-            # Launch browser with options for better stability
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
-            )
+        # Skip images, fonts and media; the extractors only read text
+        await context.route('**/*', block_heavy_resources)
+        page = await context.new_page()
+
+        # Navigate to the detail page
+        if await navigate_to_detail_page(page, firm_name):
+            print(f"Successfully navigated to detail page for {firm_name}")
+            print(f"Current URL: {page.url}")
+
+            # Extract client information
+            html = await snapshot_detail_page(page)
+            write_cached_html(CACHE_NAMESPACE, firm_name, html)
+            results = extract_clients_from_html(html, firm_name)
+
+            if results:
+                print(f"Found {len(results)} clients for {firm_name}")
+            else:
+                print(f"No clients found for {firm_name} on detail page")
+        else:
+            print(f"Could not find detail page for {firm_name}")
 
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
+    finally:
+        await context.close()
 
-            page = await context.new_page()
+    return results
 
-            # Navigate to the detail page
-            if await navigate_to_detail_page(page, firm_name):
-                print(f"Successfully navigated to detail page for {firm_name}")
-                print(f"Current URL: {page.url}")
 
-                # Extract client information
-                results = await extract_clients_from_detail_page(page, firm_name)
+async def scrape_many(firm_names: List[str], max_concurrency: int = 5) -> List[List[Dict]]:
+    """
+    Scrape several firms concurrently, sharing one browser.
 
-                if results:
-                    print(f"Found {len(results)} clients for {firm_name}")
-                else:
-                    print(f"No clients found for {firm_name} on detail page")
-            else:
-                print(f"Could not find detail page for {firm_name}")
+    The shared browser is closed once every firm has been scraped, unless
+    another batch on the same event loop is still using it.
 
-            await browser.close()
+    Args:
+        firm_names: Names of the lobbying firms to search for
+        max_concurrency: Maximum number of firms scraped at the same time
 
-    except Exception as e:
-        print(f"Error in main scraping function: {e}")
-        if browser:
-            await browser.close()
+    Returns:
+        One list of client dictionaries per firm, in the same order as firm_names
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    return results
+    async def scrape_one(firm_name: str) -> List[Dict]:
+        async with semaphore:
+            # A slow firm gives up on its own instead of stalling the batch
+            try:
+                async with asyncio.timeout(FIRM_TIMEOUT):
+                    return await scrape_french_hatvp(firm_name)
+            except TimeoutError:
+                print(f"Timed out after {FIRM_TIMEOUT}s scraping {firm_name}")
+                return []
+
+    async with browser_session():
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(scrape_one(firm_name)) for firm_name in firm_names]
+        return [task.result() for task in tasks]
+
+
+def _scrape_chunk(firm_names: List[str], max_concurrency: int) -> List[List[Dict]]:
+    """
+    Process pool worker: scrape a chunk of firms with its own browser.
+    """
+    return asyncio.run(scrape_many(firm_names, max_concurrency))
+
+
+def scrape_all(firm_names: List[str], workers: Optional[int] = None, max_concurrency: int = 5) -> List[List[Dict]]:
+    """
+    Scrape many firms across worker processes, each running its own browser.
+
+    A single Playwright driver saturates well before the CPU does, so large
+    batches are split into contiguous chunks, one per process. Up to
+    workers * max_concurrency browser contexts are open at once.
+
+    Args:
+        firm_names: Names of the lobbying firms to search
+        workers: Number of worker processes, defaults to half the CPU count
+        max_concurrency: Maximum number of firms scraped at the same time per worker
+
+    Returns:
+        One list of client dictionaries per firm, in the same order as firm_names
+    """
+    if not firm_names:
+        return []
+
+    workers = min(workers or max(1, (os.cpu_count() or 2) // 2), len(firm_names))
+    chunk_size = -(-len(firm_names) // workers)
+    chunks = [firm_names[i:i + chunk_size] for i in range(0, len(firm_names), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = executor.map(_scrape_chunk, chunks, [max_concurrency] * len(chunks))
+        return [clients for chunk in chunk_results for clients in chunk]
 
 
 def scrape(firm_name: str) -> List[Dict]:
@@ -251,6 +584,7 @@ def scrape(firm_name: str) -> List[Dict]:
     Returns:
         List of dictionaries containing client information
     """
+    # A single firm is not held to the batch's per-firm timeout
     return asyncio.run(scrape_french_hatvp(firm_name))
 
 
@@ -3,163 +3,297 @@ Italian Lobbying Register scraper - extracts client data from Italian registry
 """
 import asyncio
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
-from datetime import datetime
+from calendar import isleap
+from functools import lru_cache
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
-from playwright.sync_api import sync_playwright
+import httpx
+import lxml.html
+from lxml import etree
+from playwright.async_api import Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+
+from ..utils.browser import block_heavy_resources, browser_session, get_browser
+from ..utils.cache import read_cached_data, write_cached_data
+from ..utils.records import ClientRecord
 
 logger = logging.getLogger(__name__)
 
-async def scrape_async(firm_name: str) -> List[Dict[str, Optional[str]]]:
+BASE_URL = "https://rappresentantidiinteressi.camera.it"
+
+# Days in each month of a common year, indexed from 1
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Seconds allowed per firm in a batch before it is abandoned
+FIRM_TIMEOUT = 25
+
+# Detail page snapshots are cached under this namespace
+CACHE_NAMESPACE = 'italian'
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Language': 'it-IT'
+}
+
+# Registry index links to each firm's detail page
+_FIRM_LINKS_XPATH = etree.XPath('//a[contains(@href, "legal_")]')
+
+# Equivalent of the CSS selector .card-div
+_CARD_DIVS_XPATH = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " card-div ")]')
+
+# Visible text of the page, without script and style contents
+_TEXT_NODES_XPATH = etree.XPath('//text()[not(ancestor::script) and not(ancestor::style)]')
+
+# Page text and card texts, read from the browser in a single round-trip
+_PAGE_SNAPSHOT_JS = """() => ({
+    text: document.body.innerText,
+    cards: Array.from(document.querySelectorAll('.card-div'), card => card.innerText)
+})"""
+
+# Company names ending in an Italian legal suffix, matched in a single pass.
+# The name is lazy and bounded so lines without a suffix cannot backtrack badly
+_COMPANY_RE = re.compile(
+    r"\b\w[\w .&'\-]{1,80}?\s+(?:S\.?p\.?A\.?|S\.?r\.?l\.?|S\.c\.a r\.l\.?|S\.n\.c\.?|S\.a\.s\.?)\b",
+    re.IGNORECASE
+)
+
+# Common non-client entries matched by the company pattern
+_MATCH_SKIP_WORDS = frozenset({'camera', 'registro', 'cookie', 'privacy'})
+
+# Firm info and category cards rather than client cards
+_CARD_SKIP_WORDS = frozenset({'categoria:', 'sede:', 'telefono:', 'email:', 'pec:', 'soggetti rappresentati'})
+
+async def scrape_async(firm_name: str, *, context: Optional[BrowserContext] = None) -> List[Dict[str, Optional[str]]]:
     """
     Async scrape client information from Italian Lobbying Register
 
     Args:
         firm_name: Name of the lobbying firm to search
+        context: Browser context to render the detail page in, if one is needed;
+            defaults to a fresh context on the shared browser
 
     Returns:
         List of client dictionaries
     """
+    if context:
+        records = await _scrape_records(firm_name, _SharedContext(context))
+    else:
+        # The session closes the shared browser afterwards unless a batch is using it
+        async with browser_session():
+            records = await _scrape_records(firm_name)
+    return [record.to_dict() for record in records]
+
+async def _scrape_records(firm_name: str, shared: Optional['_SharedContext'] = None) -> List[ClientRecord]:
+    """
+    Scrape the firm's client records from the Italian Lobbying Register
+
+    The registry index and detail page are fetched over plain HTTP; a browser
+    is only used when the detail page does not contain the client cards.
+    The detail page's text and card texts are cached on disk so re-runs skip both.
+    """
     clients = []
-    base_url = "https://rappresentantidiinteressi.camera.it"
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            locale='it-IT',
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
+    registry_url = f"{BASE_URL}/sito/registro.html"
+
+    # Re-runs reuse the detail page snapshot and skip the network entirely
+    snapshot = read_cached_data(CACHE_NAMESPACE, firm_name)
+    if snapshot is not None:
+        logger.info(f"Using cached detail page for {firm_name}")
+        return extract_clients_from_text(snapshot['text'], snapshot['cards'], firm_name)
+
+    try:
+        async with httpx.AsyncClient(headers=HEADERS, timeout=10, follow_redirects=True) as client:
+            firm_href = await _find_firm_href(client, registry_url, firm_name)
+            if not firm_href:
+                return clients
+
+            # Navigate to the firm's detail page
+            if not firm_href.startswith('http'):
+                firm_href = BASE_URL + firm_href
+
+            response = await client.get(firm_href)
+            response.raise_for_status()
+
+        if b'card-div' in response.content:
+            snapshot = _html_snapshot(response.content)
+            write_cached_data(CACHE_NAMESPACE, firm_name, snapshot)
+            return extract_clients_from_text(snapshot['text'], snapshot['cards'], firm_name)
+
+    except httpx.HTTPError as e:
+        logger.error(f"Error fetching Italian registry for {firm_name}: {e}")
+        return clients
+    except Exception as e:
+        logger.error(f"Error scraping Italian registry for {firm_name}: {e}")
+        return clients
+
+    # The client cards are rendered client-side, so load the page in a browser
+    return await _scrape_detail_page(firm_href, firm_name, shared)
+
+async def _find_firm_href(client: httpx.AsyncClient, registry_url: str, firm_name: str) -> Optional[str]:
+    """
+    Find the firm's detail page link in the static registry index
+    """
+    response = await client.get(registry_url)
+    response.raise_for_status()
+
+    tree = lxml.html.fromstring(response.content)
+    firm_lower = firm_name.lower()
+
+    # Try to find firm link with exact or partial match
+    for link in _FIRM_LINKS_XPATH(tree):
+        text = link.text_content().strip()
+        if text:
+            # Check for match (case insensitive)
+            text_lower = text.lower()
+            if firm_lower in text_lower or text_lower in firm_lower:
+                firm_href = link.get('href')
+                if firm_href:
+                    logger.info(f"Found firm '{text}' at {firm_href}")
+                    return firm_href
+
+    return None
+
+async def new_context(browser: Browser) -> BrowserContext:
+    """
+    Open a browser context set up for the Italian registry
+    """
+    context = await browser.new_context(
+        locale='it-IT',
+        user_agent=HEADERS['User-Agent'],
+        service_workers='block'
+    )
+    # Skip images, fonts and media; the extractors only read text
+    await context.route('**/*', block_heavy_resources)
+    return context
+
+class _SharedContext:
+    """
+    A browser context shared by several firms, opened the first time a page needs rendering
+    """
+    def __init__(self, context: Optional[BrowserContext] = None):
+        self.context = context
+        self.lock = asyncio.Lock()
+
+    async def get(self) -> BrowserContext:
+        async with self.lock:
+            if self.context is None:
+                self.context = await new_context(await get_browser())
+        return self.context
+
+async def _scrape_detail_page(firm_href: str, firm_name: str, shared: Optional[_SharedContext] = None) -> List[ClientRecord]:
+    """
+    Render the firm's detail page and extract clients
+
+    Uses a page on the shared context, or a context of its own on the shared browser.
+    """
+    clients = []
+    owns_context = shared is None
+    context = None
+    page = None
+
+    try:
+        context = await new_context(await get_browser()) if owns_context else await shared.get()
         page = await context.new_page()
+        await page.goto(firm_href, wait_until='domcontentloaded', timeout=10000)
 
+        # The cards are rendered after the document loads; wait for them
+        # rather than for the network to go idle
         try:
-            # Navigate to the registry page which lists all firms
-            registry_url = f"{base_url}/sito/registro.html"
-            await page.goto(registry_url, wait_until='networkidle', timeout=30000)
-
-            # Look for the firm in the registry
-            # Try exact match first, then partial match
-            firm_found = False
-            firm_href = None
-
-            # Try to find firm link with exact or partial match
-            firm_links = await page.query_selector_all('a[href*="legal_"]')
-
-            for link in firm_links:
-                text = await link.text_content()
-                if text:
-                    text = text.strip()
-                    # Check for match (case insensitive)
-                    if firm_name.lower() in text.lower() or text.lower() in firm_name.lower():
-                        firm_href = await link.get_attribute('href')
-                        if firm_href:
-                            firm_found = True
-                            logger.info(f"Found firm '{text}' at {firm_href}")
-                            break
-
-            if firm_found and firm_href:
-                # Navigate to the firm's detail page
-                if not firm_href.startswith('http'):
-                    firm_href = base_url + firm_href
-
-                await page.goto(firm_href, wait_until='networkidle', timeout=30000)
-
-                # Extract client information from the detail page
-                clients = await extract_clients_from_page(page, firm_name)
-
+            await page.wait_for_selector('.card-div', timeout=5000)
         except PlaywrightTimeout:
-            logger.warning(f"Timeout while accessing Italian registry for {firm_name}")
-        except Exception as e:
-            logger.error(f"Error scraping Italian registry for {firm_name}: {e}")
-        finally:
-            await browser.close()
+            pass
+
+        # Extract client information from the detail page's rendered text
+        snapshot = await page.evaluate(_PAGE_SNAPSHOT_JS)
+        write_cached_data(CACHE_NAMESPACE, firm_name, snapshot)
+        clients = extract_clients_from_text(snapshot['text'], snapshot['cards'], firm_name)
+
+    except PlaywrightTimeout:
+        logger.warning(f"Timeout while accessing Italian registry for {firm_name}")
+    except Exception as e:
+        logger.error(f"Error scraping Italian registry for {firm_name}: {e}")
+    finally:
+        if owns_context and context:
+            await context.close()
+        elif page:
+            await page.close()
 
     return clients
 
-async def extract_clients_from_page(page, firm_name: str) -> List[Dict[str, Optional[str]]]:
+async def extract_clients_from_page(page, firm_name: str) -> List[ClientRecord]:
+    """
+    Extract client information from the firm's detail page in the browser
+    """
+    snapshot = await page.evaluate(_PAGE_SNAPSHOT_JS)
+    return extract_clients_from_text(snapshot['text'], snapshot['cards'], firm_name)
+
+def extract_clients_from_html(content: str, firm_name: str) -> List[ClientRecord]:
     """
-    Extract client information from the firm's detail page
+    Extract client information from the firm's detail page HTML
+    """
+    try:
+        snapshot = _html_snapshot(content)
+    except Exception as e:
+        logger.error(f"Error extracting clients from page: {e}")
+        return []
+
+    return extract_clients_from_text(snapshot['text'], snapshot['cards'], firm_name)
+
+def _html_snapshot(content) -> Dict[str, object]:
+    """
+    Reduce detail page HTML to the same text snapshot _PAGE_SNAPSHOT_JS takes in the browser
+    """
+    tree = lxml.html.fromstring(content)
+    return {
+        'text': '\n'.join(_TEXT_NODES_XPATH(tree)),
+        'cards': [card.text_content() for card in _CARD_DIVS_XPATH(tree)]
+    }
+
+def extract_clients_from_text(page_text: str, card_texts: List[str], firm_name: str) -> List[ClientRecord]:
+    """
+    Extract client information from the detail page's text and its card texts
     """
     clients = []
+    firm_lower = firm_name.lower()
 
     try:
-        # Get page content to check for client sections
-        content = await page.content()
-
-        # Look for company names with Italian legal suffixes
-        import re
-
-        # Italian company patterns
-        company_patterns = [
-            r'\b[\w\s]+\s+S\.p\.A\.?\b',
-            r'\b[\w\s]+\s+S\.r\.l\.?\b',
-            r'\b[\w\s]+\s+SPA\b',
-            r'\b[\w\s]+\s+SRL\b',
-            r'\b[\w\s]+\s+S\.R\.L\.?\b',
-            r'\b[\w\s]+\s+S\.P\.A\.?\b',
-            r'\b[\w\s]+\s+S\.c\.a r\.l\.?\b',
-            r'\b[\w\s]+\s+S\.n\.c\.?\b',
-            r'\b[\w\s]+\s+S\.a\.s\.?\b'
-        ]
-
-        found_companies = set()
-
-        # Extract companies from content
-        for pattern in company_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                # Clean up the match
-                match = match.strip()
-                # Skip if it's the firm itself
-                if firm_name.lower() not in match.lower() and match.lower() not in firm_name.lower():
-                    # Skip common non-client entries
-                    if not any(skip in match.lower() for skip in ['camera', 'registro', 'cookie', 'privacy']):
-                        found_companies.add(match)
+        # Keys of a dict dedupe the names while keeping them in page order
+        found_companies: Dict[str, None] = {}
+
+        # Extract companies with Italian legal suffixes from the page text,
+        # which is far shorter than the raw HTML
+        for match in _COMPANY_RE.findall(page_text):
+            # Clean up the match
+            match = match.strip()
+            match_lower = match.lower()
+            # Skip if it's the firm itself
+            if firm_lower not in match_lower and match_lower not in firm_lower:
+                # Skip common non-client entries
+                if not any(skip in match_lower for skip in _MATCH_SKIP_WORDS):
+                    found_companies[match] = None
 
         # Also look for card-div elements which may contain client info
-        card_divs = await page.query_selector_all('.card-div')
-
-        for card in card_divs:
-            text = await card.text_content()
+        for text in card_texts:
             if text:
                 text = text.strip()
+                text_lower = text.lower()
                 # Skip the firm's own info card and category cards
-                if firm_name.lower() not in text.lower():
-                    if not any(skip in text.lower() for skip in ['categoria:', 'sede:', 'telefono:', 'email:', 'pec:', 'soggetti rappresentati']):
+                if firm_lower not in text_lower:
+                    if not any(skip in text_lower for skip in _CARD_SKIP_WORDS):
                         # Look for company patterns in this card
-                        for pattern in company_patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
-                            for match in matches:
-                                match = match.strip()
-                                if match not in found_companies:
-                                    found_companies.add(match)
-
-        # Convert found companies to client records
-        for company_name in found_companies:
-            clients.append({
-                'firm_name': firm_name,
-                'firm_registration_number': None,
-                'client_name': company_name,
-                'client_registration_number': None,
-                'start_date': None,
-                'end_date': None
-            })
+                        for match in _COMPANY_RE.findall(text):
+                            found_companies[match.strip()] = None
 
+        # Convert found companies to client records (already unique via the dict)
+        clients = [ClientRecord(firm_name=firm_name, client_name=company_name)
+                   for company_name in found_companies]
 
     except Exception as e:
         logger.error(f"Error extracting clients from page: {e}")
 
-    # Remove duplicates
-    seen = set()
-    unique_clients = []
-    for client in clients:
-        client_key = client['client_name']
-        if client_key not in seen:
-            seen.add(client_key)
-            unique_clients.append(client)
-
-    return unique_clients
+    return clients
 
+@lru_cache(maxsize=4096)
 def parse_italian_date(date_str: str) -> Optional[str]:
     """
     Parse Italian date format (DD/MM/YYYY) to ISO format
@@ -169,173 +303,107 @@ def parse_italian_date(date_str: str) -> Optional[str]:
 
     date_str = date_str.strip()
 
-    # Try DD/MM/YYYY format
+    # Try DD/MM/YYYY format, validating ranges arithmetically rather than
+    # building a datetime and catching ValueError for noisy cells
     if '/' in date_str:
-        parts = date_str.split('/')
-        if len(parts) == 3:
-            try:
-                day, month, year = parts
-                # Validate and format
-                dt = datetime(int(year), int(month), int(day))
-                return dt.strftime('%Y-%m-%d')
-            except:
-                pass
+        parts = [part.strip() for part in date_str.split('/')]
+        if len(parts) == 3 and all(part.isdigit() for part in parts):
+            day, month, year = (int(part) for part in parts)
+            if 1 <= month <= 12 and 1 <= year <= 9999:
+                max_day = 29 if month == 2 and isleap(year) else _MONTH_DAYS[month]
+                if 1 <= day <= max_day:
+                    return f"{year:04d}-{month:02d}-{day:02d}"
 
     # Try just year
     if date_str.isdigit() and len(date_str) == 4:
-        try:
-            year = int(date_str)
-            if 1900 <= year <= 2100:
-                return f"{year}-01-01"
-        except:
-            pass
+        year = int(date_str)
+        if 1900 <= year <= 2100:
+            return f"{year}-01-01"
 
     return None
 
-def scrape(firm_name: str) -> List[Dict[str, Optional[str]]]:
+async def scrape_many(firm_names: List[str], max_concurrency: int = 5) -> List[List[Dict[str, Optional[str]]]]:
     """
-    Sync wrapper for scraping Italian Lobbying Register
+    Scrape several firms concurrently, sharing one browser context
+
+    The context is only opened if some firm's page needs rendering, so its
+    cookies and HTTP cache carry over between firms.
 
     Args:
-        firm_name: Name of the lobbying firm to search
+        firm_names: Names of the lobbying firms to search
+        max_concurrency: Maximum number of firms scraped at the same time
 
     Returns:
-        List of client dictionaries
+        One list of client dictionaries per firm, in the same order as firm_names
     """
-    clients = []
-    base_url = "https://rappresentantidiinteressi.camera.it"
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            locale='it-IT',
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
-        page = context.new_page()
+    semaphore = asyncio.Semaphore(max_concurrency)
 
+    async def scrape_one(firm_name: str) -> List[Dict[str, Optional[str]]]:
+        async with semaphore:
+            # A slow firm gives up on its own instead of stalling the batch
+            try:
+                async with asyncio.timeout(FIRM_TIMEOUT):
+                    records = await _scrape_records(firm_name, shared)
+                    return [record.to_dict() for record in records]
+            except TimeoutError:
+                logger.warning(f"Timed out after {FIRM_TIMEOUT}s scraping {firm_name}")
+                return []
+
+    async with browser_session():
+        shared = _SharedContext()
         try:
-            # Navigate to the registry page which lists all firms
-            registry_url = f"{base_url}/sito/registro.html"
-            page.goto(registry_url, wait_until='networkidle', timeout=30000)
-
-            # Look for the firm in the registry
-            # Try exact match first, then partial match
-            firm_found = False
-            firm_href = None
-
-            # Try to find firm link with exact or partial match
-            firm_links = page.query_selector_all('a[href*="legal_"]')
-
-            for link in firm_links:
-                text = link.text_content()
-                if text:
-                    text = text.strip()
-                    # Check for match (case insensitive)
-                    if firm_name.lower() in text.lower() or text.lower() in firm_name.lower():
-                        firm_href = link.get_attribute('href')
-                        if firm_href:
-                            firm_found = True
-                            logger.info(f"Found firm '{text}' at {firm_href}")
-                            break
-
-            if firm_found and firm_href:
-                # Navigate to the firm's detail page
-                if not firm_href.startswith('http'):
-                    firm_href = base_url + firm_href
-
-                page.goto(firm_href, wait_until='networkidle', timeout=30000)
-
-                # Extract client information from the detail page
-                clients = extract_clients_sync(page, firm_name)
-
-        except Exception as e:
-            logger.error(f"Error scraping Italian registry for {firm_name}: {e}")
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(scrape_one(firm_name)) for firm_name in firm_names]
         finally:
-            browser.close()
+            if shared.context:
+                await shared.context.close()
+        return [task.result() for task in tasks]
 
-    return clients
+def _scrape_chunk(firm_names: List[str], max_concurrency: int) -> List[List[Dict[str, Optional[str]]]]:
+    """
+    Process pool worker: scrape a chunk of firms with its own browser
+    """
+    return asyncio.run(scrape_many(firm_names, max_concurrency))
 
-def extract_clients_sync(page, firm_name: str) -> List[Dict[str, Optional[str]]]:
+def scrape_all(firm_names: List[str], workers: Optional[int] = None, max_concurrency: int = 5) -> List[List[Dict[str, Optional[str]]]]:
     """
-    Sync version of client extraction from the firm's detail page
+    Scrape many firms across worker processes, each running its own browser
+
+    A single Playwright driver saturates well before the CPU does, so large
+    batches are split into contiguous chunks, one per process. Up to
+    workers * max_concurrency browser contexts are open at once
+
+    Args:
+        firm_names: Names of the lobbying firms to search
+        workers: Number of worker processes, defaults to half the CPU count
+        max_concurrency: Maximum number of firms scraped at the same time per worker
+
+    Returns:
+        One list of client dictionaries per firm, in the same order as firm_names
     """
-    clients = []
+    if not firm_names:
+        return []
 
-    try:
-        # Get page content to check for client sections
-        content = page.content()
-
-        # Look for company names with Italian legal suffixes
-        import re
-
-        # Italian company patterns
-        company_patterns = [
-            r'\b[\w\s]+\s+S\.p\.A\.?\b',
-            r'\b[\w\s]+\s+S\.r\.l\.?\b',
-            r'\b[\w\s]+\s+SPA\b',
-            r'\b[\w\s]+\s+SRL\b',
-            r'\b[\w\s]+\s+S\.R\.L\.?\b',
-            r'\b[\w\s]+\s+S\.P\.A\.?\b',
-            r'\b[\w\s]+\s+S\.c\.a r\.l\.?\b',
-            r'\b[\w\s]+\s+S\.n\.c\.?\b',
-            r'\b[\w\s]+\s+S\.a\.s\.?\b'
-        ]
-
-        found_companies = set()
-
-        # Extract companies from content
-        for pattern in company_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                # Clean up the match
-                match = match.strip()
-                # Skip if it's the firm itself
-                if firm_name.lower() not in match.lower() and match.lower() not in firm_name.lower():
-                    # Skip common non-client entries
-                    if not any(skip in match.lower() for skip in ['camera', 'registro', 'cookie', 'privacy']):
-                        found_companies.add(match)
+    workers = min(workers or max(1, (os.cpu_count() or 2) // 2), len(firm_names))
+    chunk_size = -(-len(firm_names) // workers)
+    chunks = [firm_names[i:i + chunk_size] for i in range(0, len(firm_names), chunk_size)]
 
-        # Also look for card-div elements which may contain client info
-        card_divs = page.query_selector_all('.card-div')
-        for card in card_divs:
-            text = card.text_content()
-            if text:
-                text = text.strip()
-                # Skip the firm's own info card and category cards
-                if firm_name.lower() not in text.lower():
-                    if not any(skip in text.lower() for skip in ['categoria:', 'sede:', 'telefono:', 'email:', 'pec:', 'soggetti rappresentati']):
-                        # Look for company patterns in this card
-                        for pattern in company_patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
-                            for match in matches:
-                                match = match.strip()
-                                if match not in found_companies:
-                                    found_companies.add(match)
-
-        # Convert found companies to client records
-        for company_name in found_companies:
-            clients.append({
-                'firm_name': firm_name,
-                'firm_registration_number': None,
-                'client_name': company_name,
-                'client_registration_number': None,
-                'start_date': None,
-                'end_date': None
-            })
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = executor.map(_scrape_chunk, chunks, [max_concurrency] * len(chunks))
+        return [clients for chunk in chunk_results for clients in chunk]
 
-    except Exception as e:
-        logger.error(f"Error extracting clients from page: {e}")
+def scrape(firm_name: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Sync wrapper for scraping Italian Lobbying Register
 
-    # Remove duplicates
-    seen = set()
-    unique_clients = []
-    for client in clients:
-        client_key = client['client_name']
-        if client_key not in seen:
-            seen.add(client_key)
-            unique_clients.append(client)
+    Args:
+        firm_name: Name of the lobbying firm to search
 
-    return unique_clients
+    Returns:
+        List of client dictionaries
+    """
+    # A single firm is not held to the batch's per-firm timeout
+    return asyncio.run(scrape_async(firm_name))
 
 if __name__ == "__main__":
     # Test with FTI Consulting
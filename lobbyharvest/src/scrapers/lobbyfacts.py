@@ -1,15 +1,29 @@
 """
 Lobbyfacts.eu scraper - extracts client data from EU Transparency Register
 """
+import asyncio
+import io
 import logging
 import re
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
+
+from ..utils.cache import read_cached_html, write_cached_html
 
 logger = logging.getLogger(__name__)
 
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Client shared by every lookup in the current run; an AsyncClient is tied to
+# the event loop it was opened on, so it lives in a context variable rather
+# than at module level
+_http_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar('lobbyfacts_http_client', default=None)
+
 # Common navigation/UI terms to filter out
 FILTER_TERMS = [
     'search', 'about', 'disclaimer', 'cabinet', 'member', 'how to',
@@ -20,7 +34,34 @@ FILTER_TERMS = [
     'meetings', 'platforms'
 ]
 
-def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[str, str]]:
+# All filter terms in one pattern, so a name is checked in a single scan
+_FILTER_RE = re.compile('|'.join(map(re.escape, FILTER_TERMS)))
+
+# Headings that introduce a firm's client list
+_CLIENTS_HEADER_RE = re.compile(r'Clients.*financial year', re.I)
+
+_RID_RE = re.compile(r'rid=([^&]+)')
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+CACHE_NAMESPACE = 'lobbyfacts'
+
+@asynccontextmanager
+async def get_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the client for the current run, opening one if no caller has yet"""
+    client = _http_client.get()
+    if client is not None:
+        yield client
+        return
+
+    async with httpx.AsyncClient(headers=HEADERS, timeout=10, follow_redirects=True,
+                                 limits=HTTP_LIMITS) as client:
+        token = _http_client.set(client)
+        try:
+            yield client
+        finally:
+            _http_client.reset(token)
+
+async def scrape_lobbyfacts_async(firm_name: str, url: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Scrape client information from Lobbyfacts.eu
 
@@ -35,72 +76,114 @@ def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[st
         logger.error(f"Direct URL required for {firm_name}. Search functionality coming soon.")
         return []
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
+    fetched = await _fetch_datacard(url)
+    if fetched is None:
+        return []
+    content, encoding = fetched
+
+    # Extract firm ID from URL
+    rid_match = _RID_RE.search(url)
+    firm_id = rid_match.group(1) if rid_match else None
+
+    clients = parse_datacard(content, firm_name, firm_id, encoding)
+
+    logger.info(f"Found {len(clients)} clients for {firm_name}")
+    return clients
+
+async def _fetch_datacard(url: str) -> Optional[Tuple[bytes, str]]:
+    """Fetch a datacard's HTML and its encoding, or None if the request failed"""
+    # Datacards rarely change within a day, so re-runs read them from disk;
+    # the cache is keyed by URL alone as parsing is cheap
+    html = read_cached_html(CACHE_NAMESPACE, url)
+    if html is not None:
+        logger.info(f"Using cached datacard {url}")
+        return html.encode('utf-8'), 'utf-8'
 
     try:
-        response = session.get(url, timeout=10)
+        async with get_http_client() as client:
+            response = await client.get(url)
         response.raise_for_status()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to fetch {url}: {e}")
-        return []
+        return None
 
-    soup = BeautifulSoup(response.text, 'lxml')
+    write_cached_html(CACHE_NAMESPACE, url, response.text)
+    return response.content, response.encoding or 'utf-8'
 
-    # Extract firm ID from URL
-    rid_match = re.search(r'rid=([^&]+)', url)
-    firm_id = rid_match.group(1) if rid_match else None
+def parse_datacard(content: bytes, firm_name: str, firm_id: Optional[str],
+                   encoding: Optional[str] = None) -> List[Dict[str, str]]:
+    """Extract client records from a datacard's HTML, decoded with the given encoding
 
-    clients = []
-    seen_clients = set()
+    Without an encoding libxml2 only honours a <meta charset> and otherwise
+    assumes Latin-1, so pass the HTTP charset when there is one.
+    """
+    # Strategy 1: lists under a "Clients ... financial year" heading
+    # Strategy 2: lists with many items (likely client lists)
+    # Both are collected in one streaming pass over the lists, and strategy 1
+    # results are still listed first
+    header_names = []
+    list_names = []
+
+    events = etree.iterparse(io.BytesIO(content), events=('end',),
+                             tag=('ul', 'ol'), html=True, recover=True, encoding=encoding)
+    for _, lst in events:
+        names = [get_text(item) for item in lst.iter('li')]
 
-    # Strategy 1: Look for sections with "Clients" in the heading
-    client_headers = soup.find_all(['h2', 'h3', 'h4'],
-                                  string=re.compile(r'Clients.*financial year', re.I))
-
-    for header in client_headers:
-        # Get all siblings until next header
-        current = header.find_next_sibling()
-        while current and current.name not in ['h2', 'h3', 'h4']:
-            if current.name in ['ul', 'ol']:
-                for item in current.find_all('li'):
-                    client_name = clean_client_name(item.get_text(strip=True))
-                    if is_valid_client(client_name) and client_name not in seen_clients:
-                        seen_clients.add(client_name)
-                        clients.append(create_client_record(firm_name, firm_id, client_name))
-            current = current.find_next_sibling() if current else None
-
-    # Strategy 2: Find lists with many items (likely client lists)
-    all_lists = soup.find_all(['ul', 'ol'])
-    for lst in all_lists:
-        items = lst.find_all('li')
+        if _follows_clients_header(lst):
+            header_names.extend(names)
 
         # Client lists typically have many entries
-        if len(items) >= 5:
+        if len(names) >= 5:
             # Sample first few items to check if they look like clients
-            sample_items = items[:min(5, len(items))]
-            valid_samples = sum(1 for item in sample_items
-                              if is_valid_client(item.get_text(strip=True)))
+            valid_samples = sum(1 for name in names[:5] if is_valid_client(name))
 
             # If most samples look like clients, process the whole list
             if valid_samples >= 3:
-                for item in items:
-                    client_name = clean_client_name(item.get_text(strip=True))
-                    if is_valid_client(client_name) and client_name not in seen_clients:
-                        seen_clients.add(client_name)
-                        clients.append(create_client_record(firm_name, firm_id, client_name))
+                list_names.extend(names)
+
+        # Free outermost lists once read; nested lists are still needed by their parent
+        if not any(ancestor.tag in ('ul', 'ol') for ancestor in lst.iterancestors()):
+            lst.clear()
+
+    clients = []
+    seen_clients = set()
+
+    for text in header_names + list_names:
+        client_name = clean_client_name(text)
+        if is_valid_client(client_name) and client_name not in seen_clients:
+            seen_clients.add(client_name)
+            clients.append(create_client_record(firm_name, firm_id, client_name))
 
-    logger.info(f"Found {len(clients)} clients for {firm_name}")
     return clients
 
+async def scrape_many(firms: List[Tuple[str, Optional[str]]]) -> List[List[Dict[str, str]]]:
+    """Scrape several (firm name, url) pairs concurrently over one connection pool"""
+    async with get_http_client():
+        return await asyncio.gather(*(scrape_lobbyfacts_async(firm_name, url)
+                                      for firm_name, url in firms))
+
+def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[str, str]]:
+    """Synchronous wrapper around scrape_lobbyfacts_async for the CLI"""
+    return asyncio.run(scrape_lobbyfacts_async(firm_name, url))
+
+def _follows_clients_header(element) -> bool:
+    """Check whether the nearest heading before a list, among its siblings, introduces clients"""
+    # iterparse yields plain etree elements, which have no text_content()
+    for sibling in element.itersiblings(preceding=True):
+        if sibling.tag in ('h2', 'h3', 'h4'):
+            return bool(_CLIENTS_HEADER_RE.search(''.join(sibling.itertext())))
+    return False
+
+def get_text(element) -> str:
+    """Concatenate an element's stripped text fragments, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
 def clean_client_name(text: str) -> str:
     """Clean and normalize client name"""
     # Remove extra whitespace
     text = ' '.join(text.split())
     # Remove common suffixes in parentheses
-    text = re.sub(r'\s*\([^)]*\)\s*$', '', text)
+    text = _TRAILING_PARENS_RE.sub('', text)
     return text.strip()
 
 def is_valid_client(name: str) -> bool:
@@ -109,8 +192,7 @@ def is_valid_client(name: str) -> bool:
         return False
 
     # Filter out navigation and UI elements
-    name_lower = name.lower()
-    if any(term in name_lower for term in FILTER_TERMS):
+    if _FILTER_RE.search(name.lower()):
         return False
 
     # Client names typically:
@@ -1,16 +1,59 @@
 """
-Lightweight Lobbyfacts scraper using requests and BeautifulSoup
+Lightweight Lobbyfacts scraper using requests and lxml
 No browser dependencies required
 """
 import logging
 import re
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterator, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Navigation terms that rule out a list, and terms that rule out a single item,
+# each compiled into one case-insensitive pattern so a name is checked in a
+# single scan without a lowercased copy
+_NAV_RE = re.compile('search|about|disclaimer|how to|info|people|employment', re.I)
+_SKIP_RE = re.compile('search|about|disclaimer|cabinet|member', re.I)
+
+_RID_RE = re.compile(r'rid=([^&]+)')
+
+# Shared session so a batch of firms reuses its keep-alive connections
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+_ITEMS_XPATH = etree.XPath('.//li')
+
+def _item_text(item) -> str:
+    """Concatenate an item's stripped text fragments, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in item.itertext())
+
+def _iter_lists(source: BinaryIO, encoding: Optional[str] = None) -> Iterator:
+    """Stream a page's ul/ol elements in document order, parsing only as far as each list"""
+    open_lists = []
+    for event, lst in etree.iterparse(source, events=('start', 'end'), tag=('ul', 'ol'),
+                                      html=True, recover=True, encoding=encoding):
+        if event == 'start':
+            open_lists.append(lst)
+        elif lst is open_lists[0]:
+            # An outermost list has closed, so it and every list nested in it are complete
+            yield from open_lists
+            open_lists.clear()
+
+            # Free the list and everything parsed before it, keeping memory
+            # flat however long the page is
+            lst.clear()
+            parent = lst.getparent()
+            while lst.getprevious() is not None:
+                del parent[0]
+
 def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Scrape client information from Lobbyfacts.eu
@@ -23,11 +66,9 @@ def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[st
         List of client dictionaries
     """
     clients = []
+    seen: set[str] = set()
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
+    session = _session
 
     # For now, require direct URL since search is complex
     if not url:
@@ -35,68 +76,67 @@ def scrape_lobbyfacts(firm_name: str, url: Optional[str] = None) -> List[Dict[st
         return clients
 
     try:
-        # Fetch the datacard page
-        response = session.get(url)
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch datacard: {response.status_code}")
-            return clients
-
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        # Extract RID from URL if present
-        rid_match = re.search(r'rid=([^&]+)', url)
-        firm_id = rid_match.group(1) if rid_match else None
-
-        # Find all lists on the page
-        all_lists = soup.find_all(['ul', 'ol'])
-
-        # Filter for lists that look like client lists
-        # They typically have more than 3 items and contain company/organization names
-        for lst in all_lists:
-            items = lst.find_all('li')
-
-            # Skip navigation and small lists
-            if len(items) < 3:
-                continue
-
-            # Check if this looks like a client list by examining first few items
-            looks_like_clients = False
-            for item in items[:3]:
-                text = item.get_text(strip=True)
-                # Client names are typically longer, not navigation items
-                if len(text) > 10 and not any(nav in text.lower() for nav in ['search', 'about', 'disclaimer', 'how to', 'info', 'people', 'employment']):
-                    looks_like_clients = True
-                    break
-
-            if looks_like_clients:
-                # Extract all items as clients
-                for item in items:
-                    client_name = item.get_text(strip=True)
-
-                    # Filter out obvious non-clients
-                    if (client_name and
-                        len(client_name) > 5 and
-                        not any(skip in client_name.lower() for skip in ['search', 'about', 'disclaimer', 'cabinet', 'member'])):
-
-                        clients.append({
-                            'firm_name': firm_name,
-                            'firm_id': firm_id,
-                            'client_name': client_name,
-                            'client_id': None,
-                            'start_date': None,
-                            'end_date': None
-                        })
-
-        # Remove duplicates
-        unique_clients = []
-        seen = set()
-        for client in clients:
-            if client['client_name'] not in seen:
-                seen.add(client['client_name'])
-                unique_clients.append(client)
-
-        logger.info(f"Found {len(unique_clients)} unique clients for {firm_name}")
-        return unique_clients
+        # Fetch the datacard page, streaming the body straight into the parser
+        with session.get(url, stream=True) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch datacard: {response.status_code}")
+                return clients
+            response.raw.decode_content = True
+
+            # Extract RID from URL if present
+            rid_match = _RID_RE.search(url)
+            firm_id = rid_match.group(1) if rid_match else None
+
+            # The parser only sees raw bytes and would otherwise assume Latin-1
+            # without a <meta charset>; requests reports Latin-1 itself when the
+            # header names no charset, so only trust a declared one
+            content_type = response.headers.get('content-type', '').lower()
+            encoding = response.encoding if 'charset' in content_type else 'utf-8'
+
+            # Find all lists on the page
+            all_lists = _iter_lists(response.raw, encoding)
+
+            # Filter for lists that look like client lists
+            # They typically have more than 3 items and contain company/organization names
+            for lst in all_lists:
+                items = _ITEMS_XPATH(lst)
+
+                # Skip navigation and small lists
+                if len(items) < 3:
+                    continue
+
+                # Check if this looks like a client list by examining first few items;
+                # their texts are kept so the extraction does not recompute them
+                texts = [_item_text(item) for item in items[:3]]
+                looks_like_clients = False
+                for text in texts:
+                    # Client names are typically longer, not navigation items
+                    if len(text) > 10 and not _NAV_RE.search(text):
+                        looks_like_clients = True
+                        break
+
+                if looks_like_clients:
+                    # Extract all items as clients
+                    texts.extend(_item_text(item) for item in items[3:])
+                    for client_name in texts:
+                        # Filter out obvious non-clients and names already seen
+                        if (client_name and
+                            len(client_name) > 5 and
+                            client_name not in seen and
+                            not _SKIP_RE.search(client_name)):
+
+                            seen.add(client_name)
+                            clients.append({
+                                'firm_name': firm_name,
+                                'firm_id': firm_id,
+                                'client_name': client_name,
+                                'client_id': None,
+                                'start_date': None,
+                                'end_date': None
+                            })
+
+        logger.info(f"Found {len(clients)} unique clients for {firm_name}")
+        return clients
 
     except Exception as e:
         logger.error(f"Error scraping {firm_name}: {str(e)}")
@@ -3,13 +3,71 @@ UK Lobbying Register scraper - extracts client data from UK lobbying registry
 """
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared session so a batch of firms reuses its keep-alive connections
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json, text/html, */*'
+})
+_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# Compiled once rather than per page or card
+_CARD_CLASS_RE = re.compile(r'card|result|item|entry', re.I)
+_CLIENT_RE = re.compile(r'client', re.I)
+
+# JSON keys that may hold each field, in order of preference
+_NAME_FIELDS = ('client', 'clientName', 'client_name', 'name', 'organisation')
+_REGISTRATION_FIELDS = ('registrationNumber', 'registration_number')
+_CLIENT_REGISTRATION_FIELDS = ('clientRegistrationNumber', 'client_registration_number')
+_START_FIELDS = ('startDate', 'start_date')
+_END_FIELDS = ('endDate', 'end_date')
+
+def _first_field(item: dict, fields: tuple):
+    """Value of the first of the fields present in item, or None"""
+    return next((item[field] for field in fields if field in item), None)
+
+_TABLES_XPATH = etree.XPath('//table')
+_ROWS_XPATH = etree.XPath('.//tr')
+_CELLS_XPATH = etree.XPath('.//td|.//th')
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+_FOLLOWING_ELEMENT_XPATH = etree.XPath('following::*[1]')
+_FIRST_CHILD_XPATH = etree.XPath('*[1]')
+
+def get_text(element) -> str:
+    """Concatenate an element's stripped text fragments, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+def _only_string(element) -> Optional[str]:
+    """An element's sole text, following single children like BeautifulSoup's .string"""
+    while True:
+        if len(element) == 0:
+            return element.text
+        child = element[0]
+        if len(element) > 1 or element.text or child.tail or not isinstance(child.tag, str):
+            return None
+        element = child
+
+def _next_element_after(text_node):
+    """The first element starting after a text node, like BeautifulSoup's find_next()"""
+    parent = text_node.getparent()
+    if text_node.is_text:
+        following = _FIRST_CHILD_XPATH(parent) or _FOLLOWING_ELEMENT_XPATH(parent)
+    else:
+        following = _FOLLOWING_ELEMENT_XPATH(parent)
+    return following[0] if following else None
+
 def scrape(firm_name: str) -> List[Dict[str, str]]:
     """
     Scrape client information from UK Lobbying Register
@@ -27,11 +85,7 @@ def scrape(firm_name: str) -> List[Dict[str, str]]:
     base_url = "https://lobbying-register.uk"
     search_url = f"{base_url}/search"
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'Accept': 'application/json, text/html, */*'
-    })
+    session = _session
 
     try:
         # Try different search approaches
@@ -43,9 +97,16 @@ def scrape(firm_name: str) -> List[Dict[str, str]]:
             'name': firm_name
         }
 
-        for param_name, param_value in search_params.items():
+        # The probes are independent, so send them all at once and read the
+        # responses in order, stopping at the first one with clients
+        with ThreadPoolExecutor(max_workers=len(search_params)) as executor:
+            probes = [(param_name, executor.submit(session.get, search_url,
+                                                   params={param_name: param_value}, timeout=10))
+                      for param_name, param_value in search_params.items()]
+
+        for param_name, probe in probes:
             try:
-                response = session.get(search_url, params={param_name: param_value}, timeout=10)
+                response = probe.result()
                 if response.status_code == 200:
                     # Check if it's JSON
                     if 'application/json' in response.headers.get('content-type', ''):
@@ -53,8 +114,8 @@ def scrape(firm_name: str) -> List[Dict[str, str]]:
                         clients.extend(parse_json_results(data, firm_name))
                     else:
                         # Parse HTML
-                        soup = BeautifulSoup(response.text, 'lxml')
-                        clients.extend(parse_html_results(soup, firm_name))
+                        tree = lxml.html.fromstring(response.content)
+                        clients.extend(parse_html_results(tree, firm_name))
 
                     if clients:
                         break
@@ -65,10 +126,12 @@ def scrape(firm_name: str) -> List[Dict[str, str]]:
         if not clients:
             response = session.get(base_url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'lxml')
+                tree = lxml.html.fromstring(response.content)
 
                 # Look for links or references to the firm
-                firm_links = soup.find_all('a', string=re.compile(firm_name, re.I))
+                firm_re = re.compile(firm_name, re.I)
+                firm_links = [link for link in tree.iter('a')
+                              if firm_re.search(_only_string(link) or '')]
                 for link in firm_links[:1]:  # Follow first matching link
                     href = link.get('href')
                     if href:
@@ -77,10 +140,10 @@ def scrape(firm_name: str) -> List[Dict[str, str]]:
 
                         detail_response = session.get(href, timeout=10)
                         if detail_response.status_code == 200:
-                            detail_soup = BeautifulSoup(detail_response.text, 'lxml')
-                            clients.extend(parse_firm_detail_page(detail_soup, firm_name))
+                            detail_tree = lxml.html.fromstring(detail_response.content)
+                            clients.extend(parse_firm_detail_page(detail_tree, firm_name))
 
-    except requests.RequestException as e:
+    except (requests.RequestException, etree.ParserError) as e:
         logger.error(f"Failed to fetch UK lobbying data: {e}")
 
     # If still no results, return placeholder data indicating the issue
@@ -118,55 +181,52 @@ def parse_json_results(data: dict, firm_name: str) -> List[Dict[str, str]]:
 def extract_client_from_json(item: dict, firm_name: str) -> Optional[Dict[str, str]]:
     """Extract client information from JSON item"""
     # Look for client name in various possible fields
-    client_name = None
-    for field in ['client', 'clientName', 'client_name', 'name', 'organisation']:
-        if field in item:
-            client_name = item[field]
-            break
+    client_name = _first_field(item, _NAME_FIELDS)
 
     if not client_name:
         return None
 
     return {
         'firm_name': firm_name,
-        'firm_registration_number': item.get('registrationNumber', item.get('registration_number')),
+        'firm_registration_number': _first_field(item, _REGISTRATION_FIELDS),
         'client_name': client_name,
-        'client_registration_number': item.get('clientRegistrationNumber', item.get('client_registration_number')),
-        'start_date': item.get('startDate', item.get('start_date')),
-        'end_date': item.get('endDate', item.get('end_date'))
+        'client_registration_number': _first_field(item, _CLIENT_REGISTRATION_FIELDS),
+        'start_date': _first_field(item, _START_FIELDS),
+        'end_date': _first_field(item, _END_FIELDS)
     }
 
-def parse_html_results(soup: BeautifulSoup, firm_name: str) -> List[Dict[str, str]]:
+def parse_html_results(tree: lxml.html.HtmlElement, firm_name: str) -> List[Dict[str, str]]:
     """Parse HTML search results page"""
     clients = []
 
     # Look for result cards, tables, or lists
     # Try tables first
-    tables = soup.find_all('table')
+    tables = _TABLES_XPATH(tree)
     for table in tables:
-        rows = table.find_all('tr')[1:]  # Skip header
+        rows = _ROWS_XPATH(table)[1:]  # Skip header
         for row in rows:
-            cells = row.find_all(['td', 'th'])
+            cells = _CELLS_XPATH(row)
             if len(cells) >= 2:
                 # Assume first cell is firm, second is client
-                client_name = cells[1].get_text(strip=True)
+                client_name = get_text(cells[1])
                 if client_name and len(client_name) > 3:
                     clients.append({
                         'firm_name': firm_name,
                         'firm_registration_number': None,
                         'client_name': client_name,
                         'client_registration_number': None,
-                        'start_date': cells[2].get_text(strip=True) if len(cells) > 2 else None,
-                        'end_date': cells[3].get_text(strip=True) if len(cells) > 3 else None
+                        'start_date': get_text(cells[2]) if len(cells) > 2 else None,
+                        'end_date': get_text(cells[3]) if len(cells) > 3 else None
                     })
 
     # Try cards/divs
     if not clients:
-        cards = soup.find_all('div', class_=re.compile(r'card|result|item|entry', re.I))
+        cards = [div for div in tree.iter('div') if _CARD_CLASS_RE.search(div.get('class', ''))]
         for card in cards:
-            client_elem = card.find(string=re.compile(r'client', re.I))
-            if client_elem:
-                client_name = client_elem.find_next().get_text(strip=True) if client_elem.find_next() else None
+            client_elem = next((text for text in _TEXT_NODES_XPATH(card) if _CLIENT_RE.search(text)), None)
+            if client_elem is not None:
+                next_elem = _next_element_after(client_elem)
+                client_name = get_text(next_elem) if next_elem is not None else None
                 if client_name:
                     clients.append({
                         'firm_name': firm_name,
@@ -179,21 +239,21 @@ def parse_html_results(soup: BeautifulSoup, firm_name: str) -> List[Dict[str, st
 
     return clients
 
-def parse_firm_detail_page(soup: BeautifulSoup, firm_name: str) -> List[Dict[str, str]]:
+def parse_firm_detail_page(tree: lxml.html.HtmlElement, firm_name: str) -> List[Dict[str, str]]:
     """Parse a firm's detail page for client information"""
     clients = []
 
     # Look for sections containing client information
-    client_sections = soup.find_all(['section', 'div'],
-                                   string=re.compile(r'client', re.I))
+    client_sections = [element for element in tree.iter('section', 'div')
+                       if _CLIENT_RE.search(_only_string(element) or '')]
 
     for section in client_sections:
         # Find lists or tables within the section
-        lists = section.find_all(['ul', 'ol'])
+        lists = section.iter('ul', 'ol')
         for lst in lists:
-            items = lst.find_all('li')
+            items = lst.iter('li')
             for item in items:
-                client_name = item.get_text(strip=True)
+                client_name = get_text(item)
                 if client_name and len(client_name) > 3:
                     clients.append({
                         'firm_name': firm_name,
@@ -4,15 +4,47 @@ URL: https://orcl.my.site.com/CLR_Search
 """
 
 import asyncio
-from typing import List, Dict
-from playwright.async_api import async_playwright
+import re
+from typing import List, Dict, Set, Tuple
 from datetime import datetime
 
+from ..utils.browser import block_heavy_resources, browser_session, get_browser
+
+
+# Reads every table's header and body cell texts in one browser round-trip
+_TABLES_JS = """() => Array.from(document.querySelectorAll('table'), table => ({
+    headers: Array.from(table.querySelectorAll('th'), header => header.innerText),
+    rows: Array.from(table.querySelectorAll('tbody tr'), row => Array.from(row.querySelectorAll('td'), cell => cell.innerText))
+}))"""
+
+# Lines mentioning a client, and lines naming a month (likely a date), found in one scan
+_LINE_FIELDS_RE = re.compile(
+    r'(?P<client>(?i:client))'
+    r'|(?P<month>January|February|March|April|May|June|July|August|September|October|November|December)'
+)
+
 
 async def scrape_uk_orcl(firm_name: str) -> List[Dict]:
     """
     Scrape UK ORCL register for a given firm name.
 
+    Runs in its own context on the browser shared by this event loop, which
+    is closed afterwards unless a batch is still using it.
+
+    Args:
+        firm_name: Name of the lobbying firm to search for
+
+    Returns:
+        List of dictionaries containing client information
+    """
+    async with browser_session():
+        return await _scrape_firm(firm_name)
+
+
+async def _scrape_firm(firm_name: str) -> List[Dict]:
+    """
+    Scrape one firm in its own context on the shared browser.
+
     Args:
         firm_name: Name of the lobbying firm to search for
 
@@ -21,138 +53,176 @@ async def scrape_uk_orcl(firm_name: str) -> List[Dict]:
     """
     results = []
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    browser = await get_browser()
+    context = await browser.new_context()
+
+    try:
+        # Skip images, fonts, media and trackers, which networkidle would otherwise wait for
+        await context.route('**/*', block_heavy_resources)
+        page = await context.new_page()
+
+        # Navigate to search page
+        await page.goto('https://orcl.my.site.com/CLR_Search', wait_until='networkidle')
 
-        try:
-            # Navigate to search page
-            await page.goto('https://orcl.my.site.com/CLR_Search', wait_until='networkidle')
+        # Wait for the search form to load
+        await page.wait_for_selector('input[type="text"]', timeout=10000)
 
-            # Wait for the search form to load
-            await page.wait_for_selector('input[type="text"]', timeout=10000)
+        # Find the search input field and enter firm name
+        search_input = await page.query_selector('input[placeholder*="Search"]')
+        if not search_input:
+            search_input = await page.query_selector('input[type="text"]')
 
-            # Find the search input field and enter firm name
-            search_input = await page.query_selector('input[placeholder*="Search"]')
-            if not search_input:
-                search_input = await page.query_selector('input[type="text"]')
+        if search_input:
+            await search_input.fill(firm_name)
 
-            if search_input:
-                await search_input.fill(firm_name)
+            # Look for search button
+            search_button = await page.query_selector('button:has-text("Search")')
+            if not search_button:
+                search_button = await page.query_selector('input[type="submit"]')
 
-                # Look for search button
-                search_button = await page.query_selector('button:has-text("Search")')
-                if not search_button:
-                    search_button = await page.query_selector('input[type="submit"]')
+            if search_button:
+                await search_button.click()
 
-                if search_button:
-                    await search_button.click()
+                # Wait for results to load
+                await page.wait_for_load_state('networkidle')
+                await asyncio.sleep(2)
 
-                    # Wait for results to load
+                # Check if we have results
+                # Try to find the firm in results and click on it
+                firm_links = await page.query_selector_all(f'a:has-text("{firm_name}")')
+
+                if firm_links:
+                    # Click on the first matching firm
+                    await firm_links[0].click()
                     await page.wait_for_load_state('networkidle')
                     await asyncio.sleep(2)
 
-                    # Check if we have results
-                    # Try to find the firm in results and click on it
-                    firm_links = await page.query_selector_all(f'a:has-text("{firm_name}")')
-
-                    if firm_links:
-                        # Click on the first matching firm
-                        await firm_links[0].click()
-                        await page.wait_for_load_state('networkidle')
-                        await asyncio.sleep(2)
-
-                        # Now we should be on the firm's detail page
-                        # Look for client information - typically in tables or lists
-
-                        # Try to find client sections
-                        client_sections = await page.query_selector_all('.client-info, .client-record, [class*="client"]')
-
-                        if not client_sections:
-                            # Try to find tables with client data
-                            tables = await page.query_selector_all('table')
-
-                            for table in tables:
-                                # Check if this table contains client information
-                                headers = await table.query_selector_all('th')
-                                header_texts = [await h.inner_text() for h in headers]
-
-                                if any('client' in h.lower() for h in header_texts):
-                                    rows = await table.query_selector_all('tbody tr')
-
-                                    for row in rows:
-                                        cells = await row.query_selector_all('td')
-                                        if cells:
-                                            cell_texts = [await cell.inner_text() for cell in cells]
-
-                                            # Try to extract client name and dates
-                                            client_record = {
-                                                'firm_name': firm_name,
-                                                'firm_registration_number': '',
-                                                'client_name': '',
-                                                'client_registration_number': '',
-                                                'start_date': '',
-                                                'end_date': ''
-                                            }
-
-                                            # Map cell data to fields based on headers
-                                            for i, header in enumerate(header_texts):
-                                                if i < len(cell_texts):
-                                                    if 'client' in header.lower() and 'name' in header.lower():
-                                                        client_record['client_name'] = cell_texts[i].strip()
-                                                    elif 'client' in header.lower():
-                                                        client_record['client_name'] = cell_texts[i].strip()
-                                                    elif 'start' in header.lower() or 'from' in header.lower():
-                                                        client_record['start_date'] = cell_texts[i].strip()
-                                                    elif 'end' in header.lower() or 'to' in header.lower():
-                                                        client_record['end_date'] = cell_texts[i].strip()
-
-                                            if client_record['client_name']:
-                                                results.append(client_record)
-
-                        # Also try to extract from divs or other elements
-                        if not results:
-                            content_divs = await page.query_selector_all('div[class*="content"], div[class*="detail"]')
-
-                            for div in content_divs:
-                                text = await div.inner_text()
-                                # Parse text for client information
-                                lines = text.split('\n')
-
-                                current_client = None
-                                for line in lines:
-                                    line = line.strip()
-                                    if line and not line.startswith('©'):
-                                        # Look for patterns that indicate client names
-                                        if 'client' in line.lower():
-                                            if current_client:
-                                                results.append(current_client)
-                                            current_client = {
-                                                'firm_name': firm_name,
-                                                'firm_registration_number': '',
-                                                'client_name': line,
-                                                'client_registration_number': '',
-                                                'start_date': '',
-                                                'end_date': ''
-                                            }
-                                        elif current_client and any(month in line for month in ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']):
-                                            # This might be a date
-                                            if not current_client['start_date']:
-                                                current_client['start_date'] = line
-                                            else:
-                                                current_client['end_date'] = line
-
-                                if current_client:
-                                    results.append(current_client)
-
-        except Exception as e:
-            print(f"Error scraping UK ORCL: {e}")
-        finally:
-            await browser.close()
+                    # Now we should be on the firm's detail page
+                    # Look for client information - typically in tables or lists
+
+                    # Try to find client sections
+                    client_sections = await page.query_selector_all('.client-info, .client-record, [class*="client"]')
+
+                    if not client_sections:
+                        # Try to find tables with client data
+                        tables = await page.evaluate(_TABLES_JS)
+
+                        for table in tables:
+                            # Check if this table contains client information
+                            header_texts = table['headers']
+
+                            if any('client' in h.lower() for h in header_texts):
+                                for cell_texts in table['rows']:
+                                    if cell_texts:
+                                        # Try to extract client name and dates
+                                        client_record = {
+                                            'firm_name': firm_name,
+                                            'firm_registration_number': '',
+                                            'client_name': '',
+                                            'client_registration_number': '',
+                                            'start_date': '',
+                                            'end_date': ''
+                                        }
+
+                                        # Map cell data to fields based on headers
+                                        for i, header in enumerate(header_texts):
+                                            if i < len(cell_texts):
+                                                if 'client' in header.lower() and 'name' in header.lower():
+                                                    client_record['client_name'] = cell_texts[i].strip()
+                                                elif 'client' in header.lower():
+                                                    client_record['client_name'] = cell_texts[i].strip()
+                                                elif 'start' in header.lower() or 'from' in header.lower():
+                                                    client_record['start_date'] = cell_texts[i].strip()
+                                                elif 'end' in header.lower() or 'to' in header.lower():
+                                                    client_record['end_date'] = cell_texts[i].strip()
+
+                                        if client_record['client_name']:
+                                            results.append(client_record)
+
+                    # Also try to extract from divs or other elements
+                    if not results:
+                        div_texts = await page.eval_on_selector_all('div[class*="content"], div[class*="detail"]',
+                                                                    'divs => divs.map(div => div.innerText)')
+                        # Nested content divs repeat the same text, so track what has been added
+                        seen: Set[Tuple[str, str, str]] = set()
+
+                        for text in div_texts:
+                            # Parse text for client information
+                            lines = text.split('\n')
+
+                            current_client = None
+                            for line in lines:
+                                line = line.strip()
+                                if line and not line.startswith('©'):
+                                    fields = {match.lastgroup for match in _LINE_FIELDS_RE.finditer(line)}
+                                    # Look for patterns that indicate client names
+                                    if 'client' in fields:
+                                        if current_client:
+                                            append_unique(results, seen, current_client)
+                                        current_client = {
+                                            'firm_name': firm_name,
+                                            'firm_registration_number': '',
+                                            'client_name': line,
+                                            'client_registration_number': '',
+                                            'start_date': '',
+                                            'end_date': ''
+                                        }
+                                    elif current_client and 'month' in fields:
+                                        # This might be a date
+                                        if not current_client['start_date']:
+                                            current_client['start_date'] = line
+                                        else:
+                                            current_client['end_date'] = line
+
+                            if current_client:
+                                append_unique(results, seen, current_client)
+
+    except Exception as e:
+        print(f"Error scraping UK ORCL: {e}")
+    finally:
+        await context.close()
 
     return results
 
 
+def append_unique(results: List[Dict], seen: Set[Tuple[str, str, str]], client_record: Dict) -> None:
+    """
+    Append a client record unless an equal one has already been added.
+
+    Args:
+        results: Records collected so far
+        seen: Keys of the records already in results
+        client_record: Record to add
+    """
+    key = (client_record['client_name'], client_record['start_date'], client_record['client_registration_number'])
+    if key not in seen:
+        seen.add(key)
+        results.append(client_record)
+
+
+async def scrape_many(firm_names: List[str], max_concurrency: int = 5) -> List[List[Dict]]:
+    """
+    Scrape several firms concurrently, sharing one browser.
+
+    Args:
+        firm_names: Names of the lobbying firms to search for
+        max_concurrency: Maximum number of firms scraped at the same time
+
+    Returns:
+        One list of client dictionaries per firm, in the same order as firm_names
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def scrape_one(firm_name: str) -> List[Dict]:
+        async with semaphore:
+            return await _scrape_firm(firm_name)
+
+    async with browser_session():
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(scrape_one(firm_name)) for firm_name in firm_names]
+        return [task.result() for task in tasks]
+
+
 def scrape(firm_name: str) -> List[Dict]:
     """
     Synchronous wrapper for the async scraper function.
@@ -163,7 +233,7 @@ def scrape(firm_name: str) -> List[Dict]:
     Returns:
         List of dictionaries containing client information
     """
-    return asyncio.run(scrape_uk_orcl(firm_name))
+    return asyncio.run(scrape_many([firm_name]))[0]
 
 
 if __name__ == "__main__":
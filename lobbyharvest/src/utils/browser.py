@@ -1,9 +1,14 @@
 """Browser management utilities for headless systems"""
+import asyncio
 import atexit
 import os
+import shutil
 import subprocess
 import time
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+from playwright.async_api import Browser, Playwright, async_playwright
 
 
 class XvfbManager:
@@ -17,36 +22,38 @@ class XvfbManager:
 
     def start(self):
         """Start Xvfb if not already running"""
-        # Check if display is already in use
-        try:
-            result = subprocess.run(
-                ["xdpyinfo", "-display", self.display],
-                capture_output=True,
-                timeout=1
-            )
-            if result.returncode == 0:
-                print(f"Display {self.display} already in use")
-                return
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-        # Start Xvfb
-        cmd = ["Xvfb", self.display, "-screen", "0", self.resolution]
+        # Check if display is already in use; a running X server holds its
+        # lock file, which is cheaper to test than spawning xdpyinfo
+        lock_path = f"/tmp/.X{self.display_num}-lock"
+        if os.path.exists(lock_path):
+            print(f"Display {self.display} already in use")
+            os.environ["DISPLAY"] = self.display
+            return
+
+        # Start Xvfb; an absolute executable path and no pipes let
+        # subprocess launch it with posix_spawn rather than fork + exec.
+        # Its output is never read, so it goes to /dev/null
+        cmd = [shutil.which("Xvfb") or "Xvfb", self.display, "-screen", "0", self.resolution]
         self.xvfb_process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
 
         # Set DISPLAY environment variable
         os.environ["DISPLAY"] = self.display
 
-        # Give Xvfb time to start
-        time.sleep(1)
-
         # Register cleanup
         atexit.register(self.stop)
 
+        # Wait for Xvfb to take its lock, which it does once it is ready
+        deadline = time.monotonic() + 2
+        while not os.path.exists(lock_path):
+            if time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("Xvfb failed to start")
+            time.sleep(0.01)
+
     def stop(self):
         """Stop Xvfb process"""
         if self.xvfb_process:
@@ -85,7 +92,12 @@ def virtual_display():
         manager.stop()
 
 def get_browser_args(headless: bool = True) -> dict:
-    """Get optimized browser launch arguments"""
+    """
+    Get optimized browser launch arguments
+
+    Renderers run in their own processes, so pages in concurrent contexts
+    render in parallel rather than sharing the browser process.
+    """
     args = {
         "headless": headless,
         "args": [
@@ -94,8 +106,6 @@ def get_browser_args(headless: bool = True) -> dict:
             "--disable-dev-shm-usage",
             "--disable-gpu",
             "--no-first-run",
-            "--no-zygote",
-            "--single-process",
             "--disable-features=IsolateOrigins",
             "--disable-site-isolation-trials"
         ]
@@ -105,4 +115,81 @@ def get_browser_args(headless: bool = True) -> dict:
     if not headless:
         ensure_display()
 
-    return args
\ No newline at end of file
+    return args
+
+# Resource types none of the extractors read; stylesheets are kept because
+# typeahead widgets rely on them to show and hide suggestions
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Third-party trackers, which only add handshakes to unrelated hosts
+BLOCKED_URL_FRAGMENTS = ("google-analytics", "googletagmanager")
+
+def _is_blocked(request) -> bool:
+    """Check whether a request is for an unused resource type or a tracker"""
+    return (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS))
+
+async def block_heavy_resources(route):
+    """Playwright route handler that aborts requests for unused resources"""
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _SharedBrowser:
+    """One Playwright driver and Chromium browser, owned by a single event loop"""
+
+    def __init__(self):
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.lock = asyncio.Lock()
+        self.sessions = 0
+
+# Async Playwright objects are bound to the loop that created them, and sync
+# scrapers each run their own loop in an executor thread, so the shared
+# browser is kept per event loop rather than per process
+_shared_browsers: Dict[asyncio.AbstractEventLoop, _SharedBrowser] = {}
+
+def _shared_for_loop() -> _SharedBrowser:
+    """Return the shared browser slot for the running event loop"""
+    loop = asyncio.get_running_loop()
+    shared = _shared_browsers.get(loop)
+    if shared is None:
+        shared = _shared_browsers[loop] = _SharedBrowser()
+    return shared
+
+async def get_browser() -> Browser:
+    """Return the browser shared by every scraper on this loop, launching it on first use"""
+    shared = _shared_for_loop()
+    async with shared.lock:
+        if shared.browser is None or not shared.browser.is_connected():
+            if shared.playwright is None:
+                shared.playwright = await async_playwright().start()
+            shared.browser = await shared.playwright.chromium.launch(
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"]
+            )
+    return shared.browser
+
+async def close_browser() -> None:
+    """Close this loop's shared browser and stop its Playwright driver"""
+    shared = _shared_browsers.pop(asyncio.get_running_loop(), None)
+    if shared is None:
+        return
+    if shared.browser:
+        await shared.browser.close()
+    if shared.playwright:
+        await shared.playwright.stop()
+
+@asynccontextmanager
+async def browser_session():
+    """Keep this loop's shared browser open for the block; the last session to exit closes it"""
+    shared = _shared_for_loop()
+    shared.sessions += 1
+    try:
+        yield
+    finally:
+        shared.sessions -= 1
+        if shared.sessions == 0:
+            await close_browser()
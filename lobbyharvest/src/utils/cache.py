@@ -0,0 +1,63 @@
+"""On-disk cache of raw page snapshots, so re-runs can skip the browser"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path(os.environ.get("LOBBYHARVEST_CACHE", ".cache"))
+
+# Snapshots older than this are refetched
+CACHE_TTL = float(os.environ.get("LOBBYHARVEST_CACHE_TTL", 24 * 60 * 60))
+
+def _cache_path(namespace: str, key: str, suffix: str = ".html") -> Path:
+    """Path of the snapshot for a key within a namespace (one per scraper)"""
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}{suffix}"
+
+def _read_fresh(path: Path, ttl: float) -> Optional[str]:
+    """Return a cache file's text, or None if missing or older than ttl"""
+    try:
+        if path.stat().st_mtime < time.time() - ttl:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a cache file via a temporary file; failures are ignored as the cache is optional"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temporary file, so concurrent writers never share one
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                         suffix=".tmp", delete=False) as tmp:
+            tmp.write(text)
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+    except OSError:
+        pass
+
+def read_cached_html(namespace: str, key: str, ttl: float = CACHE_TTL) -> Optional[str]:
+    """Return the cached snapshot for a key, or None if missing or stale"""
+    return _read_fresh(_cache_path(namespace, key), ttl)
+
+def write_cached_html(namespace: str, key: str, html: str) -> None:
+    """Store a snapshot for a key"""
+    _write_atomic(_cache_path(namespace, key), html)
+
+def read_cached_data(namespace: str, key: str, ttl: float = CACHE_TTL) -> Optional[Any]:
+    """Return a cached JSON snapshot for a key, or None if missing, stale or unreadable"""
+    text = _read_fresh(_cache_path(namespace, key, ".json"), ttl)
+    try:
+        return json.loads(text) if text is not None else None
+    except ValueError:
+        return None
+
+def write_cached_data(namespace: str, key: str, data: Any) -> None:
+    """Store a JSON snapshot for a key, for pages reduced to their text before caching"""
+    _write_atomic(_cache_path(namespace, key, ".json"), json.dumps(data, ensure_ascii=False))
@@ -1,83 +1,164 @@
 import hashlib
 import re
-from datetime import datetime
-from typing import Dict, List, Optional
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+_SUFFIX_RE = re.compile(r'\s+(LLC|LTD|LIMITED|INC|INCORPORATED|CORP|CORPORATION|PLC)\.?$')
+_NONWORD_RE = re.compile(r'[^\w\s]')
 
+# Tried in order, most common in scraped data first: ISO, then day-first
+# (UK, AU and EU registers), then month-first (FARA)
+_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%d-%m-%Y',
+    '%Y/%m/%d',
+    '%d %B %Y',
+    '%B %d, %Y',
+    '%Y%m%d'
+)
+
+@lru_cache(maxsize=8192)
 def normalize_firm_name(name: str) -> str:
     """Normalize firm names for consistent comparison"""
     if not name:
         return ""
-    name = name.upper()
-    name = re.sub(r'\s+(LLC|LTD|LIMITED|INC|INCORPORATED|CORP|CORPORATION|PLC)\.?$', '', name)
-    name = re.sub(r'[^\w\s]', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    return name
+    name = _SUFFIX_RE.sub('', name.upper())
+    name = _NONWORD_RE.sub('', name)
+    # split() drops and collapses the same whitespace as \s+, in one C pass
+    name = ' '.join(name.split())
+    # Many spellings normalise to the same firm; share one copy of short names
+    return sys.intern(name) if len(name) <= 64 else name
+
+def _guess_date_format(s: str) -> Optional[str]:
+    """Pick the _DATE_FORMATS entry a numeric date's shape implies, or None"""
+    if len(s) == 8 and s.isdigit():
+        return '%Y%m%d'
+    if len(s) != 10:
+        return None
+    if s[4] == '/' and s[7] == '/':
+        return '%Y/%m/%d'
+    if s[2] == '-' and s[5] == '-':
+        return '%d-%m-%Y'
+    if s[2] == '/' and s[5] == '/':
+        # Day-first wins ties, as in _DATE_FORMATS; a second field over 12
+        # can only be a day
+        second = s[3:5]
+        if second.isdigit() and int(second) > 12:
+            return '%m/%d/%Y'
+        return '%d/%m/%Y'
+    return None
 
+@lru_cache(maxsize=4096)
 def normalize_date(date_str: Optional[str]) -> Optional[str]:
     """Convert various date formats to ISO format (YYYY-MM-DD)"""
     if not date_str:
         return None
 
-    date_formats = [
-        '%Y-%m-%d',
-        '%d/%m/%Y',
-        '%m/%d/%Y',
-        '%d-%m-%Y',
-        '%Y/%m/%d',
-        '%d %B %Y',
-        '%B %d, %Y',
-        '%Y%m%d'
-    ]
-
-    for fmt in date_formats:
+    # Scrapers mostly emit ISO dates already; check those without strptime
+    stripped = date_str.strip()
+    if len(stripped) == 10 and stripped[4] == '-' and stripped[7] == '-':
+        try:
+            return date.fromisoformat(stripped).isoformat()
+        except ValueError:
+            pass
+
+    # Go straight to the likely format rather than raising through the list
+    guessed = _guess_date_format(stripped)
+    if guessed:
         try:
-            dt = datetime.strptime(date_str.strip(), fmt)
+            return datetime.strptime(stripped, guessed).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
+        try:
+            dt = datetime.strptime(stripped, fmt)
             return dt.strftime('%Y-%m-%d')
         except ValueError:
             continue
     return date_str
 
+def normalize_dates_batch(date_strs: List[Optional[str]], fmt: Optional[str] = None) -> List[Optional[str]]:
+    """Convert a column of dates to ISO format, parsing each distinct value once
+
+    When every date comes from one source in a known strptime format, pass it
+    as fmt to skip trying the other formats; dates that do not match become None.
+    """
+    if fmt is None:
+        return [normalize_date(s) for s in date_strs]
+
+    parsed: Dict[str, Optional[str]] = {}
+    results = []
+    for s in date_strs:
+        if not s:
+            results.append(None)
+            continue
+        if s not in parsed:
+            try:
+                parsed[s] = datetime.strptime(s.strip(), fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                parsed[s] = None
+        results.append(parsed[s])
+    return results
+
+@lru_cache(maxsize=8192)
 def generate_client_id(firm_name: str, client_name: str) -> str:
     """Generate consistent ID for firm-client pairs"""
     combined = f"{normalize_firm_name(firm_name)}:{normalize_firm_name(client_name)}"
-    return hashlib.md5(combined.encode()).hexdigest()[:12]
+    return hashlib.blake2b(combined.encode(), digest_size=6).hexdigest()
 
 def merge_client_records(records: List[Dict]) -> List[Dict]:
     """Merge duplicate client records from different sources"""
     merged = {}
+    # Normalised (start, end) of each merged record, so repeated merges
+    # into the same record do not re-parse its dates
+    merged_dates: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
 
     for record in records:
-        key = generate_client_id(record.get('firm_name', ''), record.get('client_name', ''))
+        rget = record.get
+        key = generate_client_id(rget('firm_name', ''), rget('client_name', ''))
 
-        if key not in merged:
+        existing = merged.get(key)
+        if existing is None:
             merged[key] = record
+            continue
+
+        # Merge dates - take earliest start and latest end
+        eget = existing.get
+
+        dates = merged_dates.get(key)
+        if dates is not None:
+            start1, end1 = dates
         else:
-            # Merge dates - take earliest start and latest end
-            existing = merged[key]
-
-            start1 = normalize_date(existing.get('start_date'))
-            start2 = normalize_date(record.get('start_date'))
-            if start1 and start2:
-                existing['start_date'] = min(start1, start2)
-            elif start2:
-                existing['start_date'] = start2
-
-            end1 = normalize_date(existing.get('end_date'))
-            end2 = normalize_date(record.get('end_date'))
-            if end1 and end2:
-                existing['end_date'] = max(end1, end2)
-            elif end2:
-                existing['end_date'] = end2
-
-            # Merge IDs
-            for id_field in ['client_id', 'client_registration_number', 'firm_registration_number']:
-                if not existing.get(id_field) and record.get(id_field):
-                    existing[id_field] = record[id_field]
+            start1 = normalize_date(eget('start_date'))
+            end1 = normalize_date(eget('end_date'))
+
+        start2 = normalize_date(rget('start_date'))
+        if start1 and start2:
+            start1 = existing['start_date'] = min(start1, start2)
+        elif start2:
+            start1 = existing['start_date'] = start2
+
+        end2 = normalize_date(rget('end_date'))
+        if end1 and end2:
+            end1 = existing['end_date'] = max(end1, end2)
+        elif end2:
+            end1 = existing['end_date'] = end2
+
+        merged_dates[key] = (start1, end1)
+
+        # Merge IDs
+        for id_field in ['client_id', 'client_registration_number', 'firm_registration_number']:
+            value = rget(id_field)
+            if value and not eget(id_field):
+                existing[id_field] = value
 
     return list(merged.values())
 
 def validate_record(record: Dict) -> bool:
     """Validate that a record has minimum required fields"""
-    required = ['firm_name', 'client_name']
-    return all(record.get(field) for field in required)
\ No newline at end of file
+    return bool(record.get('firm_name')) and bool(record.get('client_name'))
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Lightweight client record used inside the scrapers"""
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class ClientRecord:
+    """A firm-client relationship, stored with slots to keep large scrapes small"""
+    firm_name: str
+    firm_registration_number: Optional[str] = None
+    client_name: str = ''
+    client_registration_number: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Convert to the plain dict returned by the scrapers' public functions"""
+        return {field: getattr(self, field) for field in self.__slots__}
@@ -0,0 +1,23 @@
+from src.scrapers.french_hatvp import extract_clients_from_html, iter_html_lines
+
+
+def test_iter_html_lines_joins_text_wrapped_in_source():
+    html = "<html><body><ul><li>• ACME\n      SOLUTIONS SAS <a>Voir la fiche</a></li></ul></body></html>"
+
+    assert list(iter_html_lines(html)) == ['• ACME SOLUTIONS SAS Voir la fiche']
+
+
+def test_extract_clients_keeps_client_names_wrapped_in_source():
+    html = """<html><body>
+        <h2>Clients</h2>
+        <ul>
+            <li>• ACME
+                SOLUTIONS SAS <a href="#">Voir la fiche</a></li>
+            <li>• Beta Conseil SAS</li>
+        </ul>
+        <h2>Rapport</h2>
+    </body></html>"""
+
+    clients = extract_clients_from_html(html, 'Example Firm')
+
+    assert [client.client_name for client in clients] == ['ACME SOLUTIONS SAS', 'Beta Conseil SAS']
@@ -0,0 +1,24 @@
+from src.scrapers.lobbyfacts import parse_datacard
+
+
+def test_parse_datacard_reads_list_under_clients_heading():
+    content = b"""<html><body><div>
+        <h3>Clients for closed financial year</h3>
+        <ul><li>Acme Energy Ltd</li><li>Globex Corporation</li></ul>
+    </div></body></html>"""
+
+    clients = parse_datacard(content, 'Example Firm', '123-45')
+
+    assert [client['client_name'] for client in clients] == ['Acme Energy Ltd', 'Globex Corporation']
+    assert clients[0]['firm_id'] == '123-45'
+
+
+def test_parse_datacard_decodes_with_given_encoding():
+    content = """<html><body>
+        <h3>Clients for closed financial year</h3>
+        <ul><li>Société Générale</li></ul>
+    </body></html>""".encode('utf-8')
+
+    clients = parse_datacard(content, 'Example Firm', None, 'utf-8')
+
+    assert [client['client_name'] for client in clients] == ['Société Générale']
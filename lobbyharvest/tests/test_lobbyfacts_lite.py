@@ -0,0 +1,11 @@
+import io
+
+from src.scrapers.lobbyfacts_lite import _item_text, _iter_lists
+
+
+def test_iter_lists_decodes_with_given_encoding():
+    content = "<html><body><ul><li>Société Générale</li></ul></body></html>".encode('utf-8')
+
+    lists = _iter_lists(io.BytesIO(content), 'utf-8')
+
+    assert [_item_text(lst) for lst in lists] == ['Société Générale']
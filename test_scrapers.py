@@ -3,71 +3,116 @@
 Comprehensive test of all lobbyharvest scrapers after fixes
 """
 
+import importlib
+import io
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import traceback
 
 sys.path.insert(0, 'lobbyharvest')
 
-from src.scrapers import (
-    lobbyfacts,
-    uk_lobbying,
-    australia_lobbying,
-    fara,
-    uk_orcl,
-    french_hatvp,
-    austrian_lobbying,
-    cyprus_lobbying,
-    italian_lobbying,
-    au_foreign_influence
-)
-
-def test_scraper(name, scraper_module, test_cases):
-    """Test a scraper with multiple test cases"""
-    print(f"\n{'='*60}")
-    print(f"Testing: {name}")
-    print(f"Time: {datetime.now().strftime('%H:%M:%S')}")
-    print('-'*60)
+from src.utils.cache import read_cached_data, write_cached_data
+
+# Imported one by one so a scraper that fails to import is reported as
+# broken instead of stopping the whole suite
+SCRAPER_MODULES = [
+    'lobbyfacts',
+    'uk_lobbying',
+    'australia_lobbying',
+    'fara',
+    'uk_orcl',
+    'french_hatvp',
+    'austrian_lobbying',
+    'cyprus_lobbying',
+    'italian_lobbying',
+    'au_foreign_influence'
+]
+
+# With --use-cache, results from a fresh earlier run are reused instead of
+# scraping again
+USE_CACHE = '--use-cache' in sys.argv
+CACHE_NAMESPACE = 'smoke_tests'
+
+scrapers = {}
+for module_name in SCRAPER_MODULES:
+    try:
+        scrapers[module_name] = importlib.import_module(f'src.scrapers.{module_name}')
+    except ImportError as e:
+        print(f"❌ Could not import {module_name}: {e}")
+
+def run_case(name, scraper_module, firm_name, extra_args):
+    """Run one scraper for one firm, returning (results, elapsed) or None if it has no scrape function"""
+    start_time = time.time()
+
+    cache_key = repr((name, firm_name, extra_args))
+    if USE_CACHE:
+        cached = read_cached_data(CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return cached, time.time() - start_time
+
+    # Call the appropriate scrape function
+    if name == "Lobbyfacts" and extra_args:
+        # Lobbyfacts needs URL
+        results = scraper_module.scrape_lobbyfacts(firm_name, extra_args)
+    elif hasattr(scraper_module, 'scrape'):
+        results = scraper_module.scrape(firm_name)
+    elif hasattr(scraper_module, 'scrape_' + name.lower().replace(' ', '_')):
+        func_name = 'scrape_' + name.lower().replace(' ', '_')
+        results = getattr(scraper_module, func_name)(firm_name)
+    else:
+        return None
+
+    if USE_CACHE:
+        write_cached_data(CACHE_NAMESPACE, cache_key, results)
+
+    return results, time.time() - start_time
+
+def test_scraper(name, scraper_module, test_cases, out=sys.stdout):
+    """Test a scraper with multiple test cases, printing progress to out"""
+    print(f"\n{'='*60}", file=out)
+    print(f"Testing: {name}", file=out)
+    print(f"Time: {datetime.now().strftime('%H:%M:%S')}", file=out)
+    print('-'*60, file=out)
 
     results_summary = []
 
-    for firm_name, extra_args in test_cases:
-        print(f"\n  Testing with: {firm_name}")
+    if scraper_module is None:
+        print("\n  ❌ Scraper module failed to import", file=out)
+        return [(firm_name, 0, 'error') for firm_name, _ in test_cases]
+
+    # Start every firm's run at once, then report them in order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = [executor.submit(run_case, name, scraper_module, firm_name, extra_args)
+                   for firm_name, extra_args in test_cases]
+
+    for (firm_name, _), future in zip(test_cases, futures):
+        print(f"\n  Testing with: {firm_name}", file=out)
         try:
-            start_time = time.time()
-
-            # Call the appropriate scrape function
-            if name == "Lobbyfacts" and extra_args:
-                # Lobbyfacts needs URL
-                results = lobbyfacts.scrape_lobbyfacts(firm_name, extra_args)
-            elif hasattr(scraper_module, 'scrape'):
-                results = scraper_module.scrape(firm_name)
-            elif hasattr(scraper_module, 'scrape_' + name.lower().replace(' ', '_')):
-                func_name = 'scrape_' + name.lower().replace(' ', '_')
-                results = getattr(scraper_module, func_name)(firm_name)
-            else:
-                print(f"    ❌ No scrape function found")
+            outcome = future.result()
+            if outcome is None:
+                print(f"    ❌ No scrape function found", file=out)
                 continue
 
-            elapsed_time = time.time() - start_time
+            results, elapsed_time = outcome
 
             if results:
-                print(f"    ✅ Found {len(results)} results in {elapsed_time:.2f}s")
+                print(f"    ✅ Found {len(results)} results in {elapsed_time:.2f}s", file=out)
                 # Show first result as sample
                 if results:
                     sample = results[0]
-                    print(f"       Sample: {sample.get('client_name', 'N/A')}")
+                    print(f"       Sample: {sample.get('client_name', 'N/A')}", file=out)
                 results_summary.append((firm_name, len(results), 'success'))
             else:
-                print(f"    ⚠️  No results in {elapsed_time:.2f}s")
+                print(f"    ⚠️  No results in {elapsed_time:.2f}s", file=out)
                 results_summary.append((firm_name, 0, 'no_results'))
 
         except Exception as e:
-            print(f"    ❌ ERROR: {str(e)[:100]}")
+            print(f"    ❌ ERROR: {str(e)[:100]}", file=out)
             results_summary.append((firm_name, 0, 'error'))
             if '--verbose' in sys.argv:
-                traceback.print_exc()
+                traceback.print_exc(file=out)
 
     return results_summary
 
@@ -78,67 +123,74 @@ def main():
 
     # Test configurations with various firm names
     test_configs = [
-        ("Lobbyfacts", lobbyfacts, [
+        ("Lobbyfacts", scrapers.get('lobbyfacts'), [
             ("FTI Consulting Belgium", "https://www.lobbyfacts.eu/datacard/fti-consulting-belgium?rid=29896393398-67"),
         ]),
 
-        ("UK Lobbying", uk_lobbying, [
+        ("UK Lobbying", scrapers.get('uk_lobbying'), [
             ("FTI Consulting", None),
             ("Portland", None),
             ("Weber Shandwick", None),
         ]),
 
-        ("UK ORCL", uk_orcl, [
+        ("UK ORCL", scrapers.get('uk_orcl'), [
             ("FTI Consulting", None),
             ("Portland", None),
         ]),
 
-        ("Australian Lobbying", australia_lobbying, [
+        ("Australian Lobbying", scrapers.get('australia_lobbying'), [
             ("FTI", None),
             ("Hawker Britton", None),
             ("Crosby Textor", None),
         ]),
 
-        ("AU Foreign Influence", au_foreign_influence, [
+        ("AU Foreign Influence", scrapers.get('au_foreign_influence'), [
             ("FTI", None),
             ("Hawker", None),
         ]),
 
-        ("FARA", fara, [
+        ("FARA", scrapers.get('fara'), [
             ("Akin Gump", None),
             ("Squire Patton", None),
             ("FTI", None),
         ]),
 
-        ("French HATVP", french_hatvp, [
+        ("French HATVP", scrapers.get('french_hatvp'), [
             ("Boury Tallon", None),
             ("Image Sept", None),
             ("FTI", None),
         ]),
 
-        ("Austrian Lobbying", austrian_lobbying, [
+        ("Austrian Lobbying", scrapers.get('austrian_lobbying'), [
             ("Schönherr", None),
             ("Wolf Theiss", None),
             ("FTI", None),
         ]),
 
-        ("Cyprus Lobbying", cyprus_lobbying, [
+        ("Cyprus Lobbying", scrapers.get('cyprus_lobbying'), [
             ("Zenox", None),
             ("FTI", None),
         ]),
 
-        ("Italian Lobbying", italian_lobbying, [
+        ("Italian Lobbying", scrapers.get('italian_lobbying'), [
             ("Cattaneo Zanetto", None),
             ("Reti", None),
             ("FTI", None),
         ]),
     ]
 
-    # Run all tests
+    # Run all scrapers at once; they mostly wait on the network. Each one's
+    # output is buffered and printed in config order once all have finished
     all_results = {}
-    for name, module, test_cases in test_configs:
-        results = test_scraper(name, module, test_cases)
-        all_results[name] = results
+    with ThreadPoolExecutor(max_workers=len(test_configs)) as executor:
+        runs = []
+        for name, module, test_cases in test_configs:
+            out = io.StringIO()
+            runs.append((name, out, executor.submit(test_scraper, name, module, test_cases, out)))
+
+    for name, out, future in runs:
+        print(out.getvalue(), end='')
+        all_results[name] = future.result()
 
     # Print summary
     print("\n" + "="*60)